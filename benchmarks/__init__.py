@@ -0,0 +1,36 @@
+"""
+Performance benchmarks for django-measurement.
+
+The benchmarks use pytest-benchmark and run against the in-memory SQLite
+database of the test suite. They are not collected by the regular test run::
+
+    pytest benchmarks --benchmark-autosave
+
+``--benchmark-autosave`` stores the results as JSON in ``.benchmarks/``;
+``pytest-benchmark compare`` compares runs, e.g. across releases.
+``BENCHMARK_ROWS`` sets the number of rows used by queryset benchmarks.
+"""
+import os
+
+from measurement import measures
+
+from django_measurement.utils import get_measurement
+from tests.custom_measure_base import DegreePerTime
+from tests.models import MeasurementTestModel
+
+ROWS = int(os.environ.get("BENCHMARK_ROWS", 100000))
+
+
+def build_instances(count):
+    return [
+        MeasurementTestModel(
+            measurement_distance=get_measurement(measures.Distance, i, "km"),
+            measurement_weight=get_measurement(measures.Weight, i, "lb"),
+            measurement_speed=get_measurement(measures.Speed, i, "mi__hr"),
+            measurement_temperature=get_measurement(measures.Temperature, i, "c"),
+            measurement_custom_degree_per_time=get_measurement(
+                DegreePerTime, i, "c__h"
+            ),
+        )
+        for i in range(count)
+    ]
@@ -0,0 +1,18 @@
+import django
+import measurement
+import pytest
+
+from tests.models import MeasurementTestModel
+
+from . import ROWS, build_instances
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info["django"] = django.get_version()
+    machine_info["measurement"] = measurement.__version__
+
+
+@pytest.fixture
+def rows(db):
+    MeasurementTestModel.objects.bulk_create(build_instances(ROWS))
+    return ROWS
@@ -0,0 +1,52 @@
+import pytest
+from measurement import measures
+
+from django_measurement import fast
+from django_measurement.models import MeasurementField
+
+BACKENDS = {
+    "measurement": "django_measurement.backends.MeasurementBackend",
+    "float": "django_measurement.backends.FloatBackend",
+}
+
+pytestmark = [
+    pytest.mark.parametrize(
+        "measure, unit, to_unit",
+        [
+            (measures.Distance, "km", "mi"),
+            (measures.Speed, "mi__hr", "km__hr"),
+            (measures.Temperature, "f", "c"),
+        ],
+        ids=["scalar", "bidimensional", "temperature"],
+    ),
+    pytest.mark.parametrize("backend", list(BACKENDS),),
+]
+
+
+def get_class(measure, backend):
+    if backend == "float":
+        return fast.MEASURES[measure]
+    return measure
+
+
+def test_construction(benchmark, measure, unit, to_unit, backend):
+    """Build a measure from a value and unit, like the form field."""
+    cls = get_class(measure, backend)
+    benchmark(lambda: cls(**{unit: 12.5}))
+
+
+def test_conversion(benchmark, measure, unit, to_unit, backend):
+    """Read a value in another unit, like templates and serializers."""
+    value = get_class(measure, backend)(**{unit: 12.5})
+    benchmark(getattr, value, to_unit)
+
+
+def test_arithmetic(benchmark, measure, unit, to_unit, backend):
+    value = get_class(measure, backend)(**{unit: 12.5})
+    benchmark(lambda: value + value)
+
+
+def test_from_db_value(benchmark, settings, measure, unit, to_unit, backend):
+    settings.MEASUREMENT_BACKEND = BACKENDS[backend]
+    field = MeasurementField(measurement=measure, unit_choices=((unit, unit),))
+    benchmark(field.from_db_value, 12.5, None, None)
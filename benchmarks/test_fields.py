@@ -0,0 +1,54 @@
+import pytest
+from measurement import measures
+
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.parametrize(
+        "fieldname, measure",
+        [
+            ("measurement_distance", measures.Distance(km=2)),
+            ("measurement_speed_mph", measures.Speed(mph=65)),
+            ("measurement_temperature", measures.Temperature(c=20)),
+        ],
+        ids=["scalar", "bidimensional", "temperature"],
+    ),
+]
+
+
+def get_field(fieldname):
+    return MeasurementTestModel._meta.get_field(fieldname)
+
+
+def test_get_prep_value(benchmark, fieldname, measure):
+    field = get_field(fieldname)
+    benchmark(field.get_prep_value, measure)
+
+
+def test_from_db_value(benchmark, fieldname, measure):
+    field = get_field(fieldname)
+    value = field.get_prep_value(measure)
+    benchmark(field.from_db_value, value, None, None)
+
+
+def test_to_python_measure(benchmark, fieldname, measure):
+    field = get_field(fieldname)
+    benchmark(field.to_python, measure)
+
+
+def test_to_python_string(benchmark, fieldname, measure):
+    field = get_field(fieldname)
+    value = "%s:%s" % (measure.value, measure.unit)
+    benchmark(field.to_python, value)
+
+
+def test_value_to_string(benchmark, fieldname, measure):
+    field = get_field(fieldname)
+    instance = MeasurementTestModel(**{fieldname: measure})
+    benchmark(field.value_to_string, instance)
+
+
+def test_deserialize_value_from_string(benchmark, fieldname, measure):
+    field = get_field(fieldname)
+    value = "%s:%s" % (measure.value, measure.unit)
+    benchmark(field.deserialize_value_from_string, value)
@@ -0,0 +1,41 @@
+import pytest
+from measurement import measures
+
+from django_measurement.forms import MeasurementField
+from tests.custom_measure_base import DegreePerTime
+from tests.forms import BiDimensionalLabelTestForm, MeasurementTestForm
+
+MEASURES = pytest.mark.parametrize(
+    "measure",
+    [measures.Distance, measures.Speed, DegreePerTime],
+    ids=["scalar", "bidimensional", "custom_bidimensional"],
+)
+
+
+@MEASURES
+def test_field_construction(benchmark, measure):
+    benchmark(MeasurementField, measure)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"measurement_distance_0": "2.0", "measurement_distance_1": "mi"},
+        {"measurement_speed_0": "2.0", "measurement_speed_1": "mi__hr"},
+    ],
+    ids=["scalar", "bidimensional"],
+)
+def test_model_form_validation(benchmark, data):
+    def validate():
+        form = MeasurementTestForm(data)
+        assert form.is_valid()
+
+    benchmark(validate)
+
+
+def test_custom_bidimensional_form_validation(benchmark):
+    def validate():
+        form = BiDimensionalLabelTestForm({"simple_0": "2.0", "simple_1": "c__h"})
+        assert form.is_valid()
+
+    benchmark(validate)
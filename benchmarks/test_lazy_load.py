@@ -0,0 +1,34 @@
+"""
+Compare eager and lazy loading of measurement fields.
+
+Run with ``pytest benchmarks/test_lazy_load.py``; the peak memory of one full
+queryset iteration is reported in the ``extra_info`` of each benchmark.
+"""
+import tracemalloc
+
+import pytest
+from django.test import override_settings
+
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+def iterate():
+    queryset = MeasurementTestModel.objects.values_list(
+        "measurement_distance", "measurement_speed"
+    )
+    return [(distance.standard, speed.standard) for distance, speed in queryset]
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_queryset_iteration(benchmark, rows, lazy):
+    with override_settings(MEASUREMENT_LAZY_LOAD=lazy):
+        tracemalloc.start()
+        assert len(iterate()) == rows
+        benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        benchmark(iterate)
@@ -0,0 +1,42 @@
+import pytest
+from django.core.management import call_command
+
+from tests.models import MeasurementTestModel
+
+from . import ROWS, build_instances
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+SERIALIZATION_ROWS = max(ROWS // 10, 1)
+
+
+def test_bulk_create(benchmark):
+    def setup():
+        MeasurementTestModel.objects.all().delete()
+        return (build_instances(ROWS),), {}
+
+    benchmark.pedantic(MeasurementTestModel.objects.bulk_create, setup=setup, rounds=3)
+
+    assert MeasurementTestModel.objects.count() == ROWS
+
+
+def test_queryset_iteration(benchmark, rows):
+    def iterate():
+        return sum(1 for _ in MeasurementTestModel.objects.iterator())
+
+    assert benchmark(iterate) == rows
+
+
+def test_dumpdata_loaddata(benchmark, tmp_path):
+    MeasurementTestModel.objects.bulk_create(build_instances(SERIALIZATION_ROWS))
+    fixture = str(tmp_path / "measurements.json")
+
+    def round_trip():
+        call_command("dumpdata", "tests", output=fixture, verbosity=0)
+        call_command("loaddata", fixture, verbosity=0)
+
+    benchmark.pedantic(round_trip, rounds=3)
+
+    assert MeasurementTestModel.objects.count() == SERIALIZATION_ROWS
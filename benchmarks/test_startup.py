@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+CODE = (
+    "import django\n"
+    "from django.conf import settings\n"
+    "settings.configure(INSTALLED_APPS=['django_measurement'])\n"
+    "django.setup()\n"
+    "import django_measurement.models\n"
+)
+
+
+def slowest_imports(stderr, count=10):
+    times = []
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, self_time, name = line.split("|")
+            times.append((int(self_time), name.strip()))
+    return sorted(times, reverse=True)[:count]
+
+
+def test_cold_start(benchmark):
+    """Start an interpreter with django-measurement installed, like a new worker."""
+
+    def start():
+        return subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", CODE],
+            stderr=subprocess.PIPE,
+            check=True,
+            universal_newlines=True,
+        )
+
+    result = benchmark.pedantic(start, rounds=5, warmup_rounds=1)
+
+    benchmark.extra_info["slowest_imports_us"] = slowest_imports(result.stderr)
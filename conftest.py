@@ -0,0 +1,20 @@
+import importlib
+
+# Modules requiring optional dependencies fail to import without them,
+# which would stop --doctest-modules while collecting.
+OPTIONAL_MODULES = {
+    "asgiref": ["django_measurement/aio.py"],
+    "numpy": [
+        "django_measurement/columnar.py",
+        "django_measurement/vectorized.py",
+        "django_measurement/management/commands/dumpmeasurementcolumn.py",
+    ],
+    "rest_framework": ["django_measurement/rest_framework.py"],
+}
+
+collect_ignore = []
+for dependency, paths in OPTIONAL_MODULES.items():
+    try:
+        importlib.import_module(dependency)
+    except ImportError:
+        collect_ignore += paths
@@ -0,0 +1,92 @@
+"""
+Helpers for reading and writing measurements from asynchronous code.
+
+Database access runs through ``sync_to_async``, and the conversion of
+measurements happens outside the event loop: in the database when reading,
+and in an executor when writing.
+"""
+import asyncio
+import functools
+import itertools
+
+from .bulk import iter_instances, save_instances
+from .query import annotate_in_units
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "django_measurement.aio requires asgiref,"
+        " install it with 'pip install django-measurement[asgi]'."
+    ) from e
+
+__all__ = ("aiter_measurements", "asave_rows")
+
+
+def _next_chunk(iterator, size):
+    return list(itertools.islice(iterator, size))
+
+
+async def aiter_measurements(queryset, *fields, unit=None, flat=False, chunk_size=2000):
+    """
+    Asynchronously yield the rows of ``queryset`` like `values_list_in`.
+
+    Measurement fields are converted to ``unit`` by the database and returned
+    as plain floats. Rows are fetched in chunks of ``chunk_size``.
+    """
+    queryset, fields = annotate_in_units(queryset, fields, unit)
+    queryset = queryset.values_list(*fields, flat=flat)
+    if hasattr(queryset, "aiterator"):
+        async for row in queryset.aiterator(chunk_size=chunk_size):
+            yield row
+        return
+
+    iterator = queryset.iterator(chunk_size=chunk_size)
+    next_chunk = sync_to_async(_next_chunk, thread_sensitive=True)
+    while True:
+        chunk = await next_chunk(iterator, chunk_size)
+        if not chunk:
+            return
+        for row in chunk:
+            yield row
+
+
+async def _abatches(rows, size):
+    if hasattr(rows, "__aiter__"):
+        batch = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    else:
+        rows = iter(rows)
+        while True:
+            batch = _next_chunk(rows, size)
+            if not batch:
+                return
+            yield batch
+
+
+async def asave_rows(model, rows, batch_size=1000, update_fields=None, executor=None):
+    """
+    Save ``model`` objects built from ``rows``, return the number of saved objects.
+
+    ``rows`` is an iterable or asynchronous iterable of dictionaries, as
+    accepted by `bulk.iter_instances`. Each batch is converted in ``executor``
+    (the event loop's default executor if omitted) and saved with
+    `bulk.save_instances`.
+    """
+    loop = asyncio.get_running_loop()
+    save = sync_to_async(save_instances, thread_sensitive=True)
+    count = 0
+    async for batch in _abatches(rows, batch_size):
+        instances = await loop.run_in_executor(
+            executor, functools.partial(list, iter_instances(model, batch))
+        )
+        count += await save(
+            model, instances, batch_size=batch_size, update_fields=update_fields
+        )
+    return count
@@ -0,0 +1,41 @@
+"""
+Measure backends, selected with the ``MEASUREMENT_BACKEND`` setting.
+
+A backend builds the values returned by `utils.get_measurement`, and thereby
+by model fields, form fields and deserialization.
+"""
+from . import utils
+
+__all__ = ("MeasurementBackend", "FloatBackend")
+
+
+class MeasurementBackend:
+    """Build python-measurement objects; the default backend."""
+
+    def build(self, measure, value, unit, original_unit=None):
+        """Return a measure holding ``value`` in ``unit``, shown in ``original_unit``."""
+        conversion = utils.get_unit_conversion(measure, unit, original_unit)
+        if not conversion.direct:
+            return utils._build_measurement(measure, value, unit, original_unit)
+        return conversion.build(value)
+
+
+class FloatBackend(MeasurementBackend):
+    """
+    Build the float based measures of `django_measurement.fast` where available.
+
+    Distance, Weight, Speed, Temperature and Volume values subclass the
+    python-measurement measures they replace; other measures are built by
+    python-measurement.
+    """
+
+    def __init__(self):
+        from .fast import MEASURES
+
+        self.measures = MEASURES
+
+    def build(self, measure, value, unit, original_unit=None):
+        fast_measure = self.measures.get(measure)
+        if fast_measure is None:
+            return super().build(measure, value, unit, original_unit)
+        return fast_measure.from_unit(value, unit, original_unit)
@@ -0,0 +1,216 @@
+"""
+Streaming import and export of models with measurement fields.
+
+Rows are processed as generators and written in batches, so memory use does
+not grow with the number of rows. Measurements are written in the
+``value:unit`` format used by `MeasurementField.value_to_string`.
+"""
+import csv
+import itertools
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import MeasurementField
+from .query import annotate_in_units, get_measurement_fields
+from .utils import get_measurement
+
+__all__ = (
+    "FORMATS",
+    "iter_rows",
+    "write_rows",
+    "read_rows",
+    "iter_instances",
+    "save_instances",
+    "export_measurements",
+    "import_measurements",
+)
+
+FORMATS = ("csv", "ndjson")
+
+EXTENSIONS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".json": "ndjson",
+}
+
+
+def _check_format(format):
+    if format not in FORMATS:
+        raise ValueError(
+            "Unknown format '%s', expected one of: %s" % (format, ", ".join(FORMATS))
+        )
+
+
+def iter_rows(queryset, fields=None, unit=None, chunk_size=2000):
+    """
+    Yield the rows of ``queryset`` as dictionaries.
+
+    Measurements are formatted as ``value:unit`` without constructing measure
+    objects. By default the stored standard values are written unchanged;
+    ``unit`` may be a unit or a dictionary mapping field names to units, to
+    have the database convert them first.
+    """
+    if not fields:
+        fields = [f.attname for f in queryset.model._meta.concrete_fields]
+    units = {
+        name: (unit.get(name) if isinstance(unit, dict) else unit)
+        or field.measurement.STANDARD_UNIT
+        for name, field in get_measurement_fields(queryset.model, fields)
+    }
+    queryset, fields = annotate_in_units(queryset, fields, units)
+    for values in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        row = dict(zip(fields, values))
+        for name, unit in units.items():
+            if row[name] is not None:
+                row[name] = "%s:%s" % (row[name], unit)
+        yield row
+
+
+def write_rows(rows, stream, fields, format="csv"):
+    """Write the dictionaries ``rows`` to ``stream`` as CSV or NDJSON."""
+    _check_format(format)
+    count = 0
+    if format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            stream.write(json.dumps(row, cls=DjangoJSONEncoder))
+            stream.write("\n")
+            count += 1
+    return count
+
+
+def read_rows(stream, format="csv"):
+    """Return an iterator over the rows of a CSV or NDJSON ``stream``."""
+    _check_format(format)
+    if format == "csv":
+        return iter(csv.DictReader(stream))
+    return (json.loads(line) for line in stream if line.strip())
+
+
+def _get_measurement_converter(field):
+    measurement = field.measurement
+    default_unit = field.get_default_unit()
+
+    def convert(value):
+        if value is None or value == "":
+            return None
+        unit = None
+        if isinstance(value, str):
+            value, _, unit = value.partition(":")
+        return get_measurement(measurement, float(value), unit or default_unit)
+
+    return convert
+
+
+def _get_converter(field):
+    def convert(value):
+        if value == "" and field.null:
+            return None
+        return field.to_python(value)
+
+    return convert
+
+
+def iter_instances(model, rows):
+    """
+    Yield unsaved ``model`` instances built from dictionaries of serialized values.
+
+    Measurements may be given as ``value:unit`` strings or as numbers in the
+    field's default unit. Unit resolution is cached, so each value is converted
+    with a single multiply-add.
+    """
+    converters = {}
+    for row in rows:
+        kwargs = {}
+        for name, value in row.items():
+            try:
+                convert = converters[name]
+            except KeyError:
+                field = model._meta.get_field(name)
+                if isinstance(field, MeasurementField):
+                    convert = _get_measurement_converter(field)
+                else:
+                    convert = _get_converter(field)
+                converters[name] = convert
+            kwargs[name] = convert(value)
+        yield model(**kwargs)
+
+
+def save_instances(model, instances, batch_size=1000, update_fields=None):
+    """
+    Save ``instances`` in batches of ``batch_size``, return the number of saved objects.
+
+    New objects are inserted with ``bulk_create``; if ``update_fields`` is given,
+    existing objects are updated with ``bulk_update`` instead. The unit columns
+    of fields declared with ``store_unit`` are updated along with them.
+    """
+    manager = model._default_manager
+    if update_fields:
+        update_fields = list(update_fields)
+        unit_fields = [
+            field
+            for name, field in get_measurement_fields(model, update_fields)
+            if field.unit_field is not None
+        ]
+        update_fields += [
+            field.unit_field.name
+            for field in unit_fields
+            if field.unit_field.name not in update_fields
+        ]
+    instances = iter(instances)
+    count = 0
+    while True:
+        batch = list(itertools.islice(instances, batch_size))
+        if not batch:
+            return count
+        if update_fields:
+            # bulk_update() does not call pre_save(), which sets the unit.
+            for field in unit_fields:
+                for instance in batch:
+                    field.pre_save(instance, False)
+            manager.bulk_update(batch, update_fields, batch_size=batch_size)
+        else:
+            manager.bulk_create(batch, batch_size=batch_size)
+        count += len(batch)
+
+
+def export_measurements(
+    queryset, stream, fields=None, unit=None, format="csv", chunk_size=2000
+):
+    """Write ``queryset`` to ``stream``, return the number of exported rows."""
+    if not fields:
+        fields = [f.attname for f in queryset.model._meta.concrete_fields]
+    rows = iter_rows(queryset, fields, unit=unit, chunk_size=chunk_size)
+    return write_rows(rows, stream, fields, format=format)
+
+
+def import_measurements(model, stream, format="csv", batch_size=1000, update=False):
+    """
+    Create ``model`` objects from the rows in ``stream``, return the number of rows.
+
+    With ``update``, rows must contain the primary key and the existing objects
+    are updated with the other columns instead.
+    """
+    rows = read_rows(stream, format=format)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    update_fields = None
+    if update:
+        pk = model._meta.pk
+        update_fields = [name for name in first if name not in (pk.name, pk.attname)]
+    rows = itertools.chain([first], rows)
+    return save_instances(
+        model,
+        iter_instances(model, rows),
+        batch_size=batch_size,
+        update_fields=update_fields,
+    )
@@ -0,0 +1,143 @@
+"""
+Export of measurement columns to memory-mappable files.
+
+A column is converted to the requested unit by the database and read with
+a server-side cursor as plain floats, without constructing measure objects.
+Requires NumPy, which can be installed with
+``pip install django-measurement[numpy]``; Arrow and Parquet files also
+require PyArrow (``pip install django-measurement[arrow]``).
+"""
+import itertools
+import os
+
+from .query import annotate_in_units, get_measurement_fields
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "django_measurement.columnar requires NumPy,"
+        " install it with 'pip install django-measurement[numpy]'."
+    ) from e
+
+__all__ = ("FORMATS", "get_format", "iter_chunks", "export_column")
+
+FORMATS = ("npy", "arrow", "parquet")
+
+CHUNK_SIZE = 100000
+
+EXTENSIONS = {
+    ".npy": "npy",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".parquet": "parquet",
+}
+
+
+def get_format(path, format=None):
+    """Return ``format``, or the format matching the extension of ``path``."""
+    if format is None:
+        format = EXTENSIONS.get(os.path.splitext(path)[1].lower(), "npy")
+    if format not in FORMATS:
+        raise ValueError(
+            "Unknown format '%s', expected one of: %s" % (format, ", ".join(FORMATS))
+        )
+    return format
+
+
+def iter_chunks(queryset, field_name, unit=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield the values of a measurement field as float64 arrays in ``unit``.
+
+    Arrays hold up to ``chunk_size`` values; ``NULL`` is returned as ``nan``.
+    ``unit`` defaults to the standard unit of the measure.
+    """
+    fields = dict(get_measurement_fields(queryset.model, [field_name]))
+    if not fields:
+        raise ValueError("%s is not a measurement field." % field_name)
+    unit = unit or fields[field_name].measurement.STANDARD_UNIT
+    queryset = annotate_in_units(queryset, [field_name], unit)[0]
+    values = queryset.values_list(field_name, flat=True).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = np.fromiter(
+            (
+                np.nan if value is None else value
+                for value in itertools.islice(values, chunk_size)
+            ),
+            dtype=np.float64,
+        )
+        if not len(chunk):
+            return
+        yield chunk
+
+
+def _write_npy(path, chunks, count):
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(count,))
+    written = 0
+    try:
+        for chunk in chunks:
+            chunk = chunk[: count - written]
+            out[written : written + len(chunk)] = chunk
+            written += len(chunk)
+            if written == count:
+                break
+        out.flush()
+    finally:
+        del out
+    if written != count:
+        raise ValueError(
+            "Expected %d rows but read %d, rows were deleted during the export."
+            % (count, written)
+        )
+    return written
+
+
+def _write_arrow(path, chunks, field_name, format):
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Exporting %s files requires PyArrow,"
+            " install it with 'pip install django-measurement[arrow]'." % format
+        ) from e
+
+    schema = pa.schema([(field_name, pa.float64())])
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(path, schema)
+    else:
+        writer = pa.ipc.new_file(path, schema)
+
+    written = 0
+    with writer:
+        for chunk in chunks:
+            batch = pa.record_batch([pa.array(chunk, from_pandas=True)], schema=schema)
+            if format == "parquet":
+                writer.write_table(pa.Table.from_batches([batch]))
+            else:
+                writer.write_batch(batch)
+            written += len(chunk)
+    return written
+
+
+def export_column(
+    queryset, field_name, path, unit=None, format=None, chunk_size=CHUNK_SIZE
+):
+    """
+    Write the values of a measurement field in ``unit`` to the file ``path``.
+
+    ``format`` is one of `FORMATS` and defaults to the one matching the file
+    extension, or ``"npy"``. ``.npy`` files hold a float64 array that can be
+    opened with ``np.load(path, mmap_mode="r")``; the rows are counted first
+    and rows added while exporting are left out. In Arrow and Parquet files,
+    the values are stored in a float64 column named ``field_name`` and
+    ``NULL`` stays null.
+
+    Return the number of exported rows.
+    """
+    format = get_format(path, format)
+    chunks = iter_chunks(queryset, field_name, unit=unit, chunk_size=chunk_size)
+    if format == "npy":
+        return _write_npy(path, chunks, queryset.count())
+    return _write_arrow(path, chunks, field_name, format)
@@ -0,0 +1,137 @@
+"""Compact measurement values for memory sensitive workloads."""
+import functools
+import operator
+
+from .utils import from_standard, get_measurement, get_unit_conversion
+
+__all__ = ("CompactMeasurement",)
+
+NUMERIC_TYPES = (int, float)
+
+
+@functools.total_ordering
+class CompactMeasurement:
+    """
+    Memory efficient stand-in for a measure.
+
+    Only the value in the measure's standard unit, the measure class and the
+    display unit are stored. Unit attributes, comparisons and arithmetic are
+    computed from cached conversion factors; `to_measure` returns the
+    equivalent python-measurement object.
+
+    Like Django's ``LazyObject``, ``__class__`` reports the measure class, so
+    ``isinstance`` checks and the operators of real measures accept compact
+    values as well.
+    """
+
+    __slots__ = ("_measure", "_standard", "_unit")
+
+    def __init__(self, measure, standard, unit=None):
+        self._measure = measure
+        self._standard = standard
+        self._unit = unit or measure.STANDARD_UNIT
+
+    __class__ = property(operator.attrgetter("_measure"))
+
+    @classmethod
+    def from_measure(cls, measure):
+        return cls(type(measure), float(measure.standard), measure.unit)
+
+    def to_measure(self):
+        return get_measurement(
+            measure=self._measure, value=self._standard, original_unit=self._unit
+        )
+
+    @property
+    def standard(self):
+        return self._standard
+
+    @property
+    def unit(self):
+        return self._unit
+
+    @unit.setter
+    def unit(self, value):
+        self._unit = get_unit_conversion(self._measure, value).unit
+
+    @property
+    def value(self):
+        return self._convert_to(self._unit)
+
+    @value.setter
+    def value(self, value):
+        conversion = get_unit_conversion(self._measure, self._unit)
+        self._standard = value * conversion.factor + conversion.offset
+
+    def _convert_to(self, unit):
+        try:
+            return from_standard(self._measure, unit, self._standard)
+        except KeyError:
+            conversion = get_unit_conversion(self._measure, unit)
+            if conversion.factor is None:
+                return getattr(self.to_measure(), unit)
+            return from_standard(self._measure, conversion.unit, self._standard)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._convert_to(name)
+        except (AttributeError, KeyError, ValueError):
+            raise AttributeError("Unknown unit type: %s" % name)
+
+    def __reduce__(self):
+        return type(self), (self._measure, self._standard, self._unit)
+
+    def __repr__(self):
+        return "%s(%s=%s)" % (self._measure.__name__, self._unit, self.value)
+
+    def __str__(self):
+        if get_unit_conversion(self._measure, self._unit).bidimensional:
+            return "%s %s" % (self.value, self._unit.replace("__", "/"))
+        return "%s %s" % (self.value, self._unit)
+
+    def __float__(self):
+        return float(self._standard)
+
+    def __bool__(self):
+        return bool(self._standard)
+
+    def __eq__(self, other):
+        if isinstance(other, self._measure):
+            return self._standard == other.standard
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, self._measure):
+            return self._standard < other.standard
+        return NotImplemented
+
+    __hash__ = None
+
+    def _new(self, standard):
+        return type(self)(self._measure, standard, self._unit)
+
+    def __add__(self, other):
+        if isinstance(other, self._measure):
+            return self._new(self._standard + other.standard)
+        return self.to_measure() + other
+
+    def __sub__(self, other):
+        if isinstance(other, self._measure):
+            return self._new(self._standard - other.standard)
+        return self.to_measure() - other
+
+    def __mul__(self, other):
+        if isinstance(other, NUMERIC_TYPES):
+            return self._new(self._standard * other)
+        return self.to_measure() * other
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, self._measure):
+            return self._standard / other.standard
+        if isinstance(other, NUMERIC_TYPES):
+            return self._new(self._standard / other)
+        return self.to_measure() / other
@@ -13,5 +13,20 @@ class DjangoMeasurementConf(AppConf):
     For measurement classes subclassing a BidimensionalMeasure, this .
     """
 
+    LAZY_LOAD = False
+    """
+    Return lazily constructed measures from the database unless a field sets ``lazy``.
+    """
+
+    INSTRUMENTATION = False
+    """
+    Send the ``measurement_event`` signal for conversions, see ``django_measurement.instrumentation``.
+    """
+
+    BACKEND = "django_measurement.backends.MeasurementBackend"
+    """
+    Dotted path of the backend building measures, see ``django_measurement.backends``.
+    """
+
     class Meta:
         prefix = "measurement"
@@ -0,0 +1,126 @@
+"""Query expressions converting measurement columns in the database."""
+from django.db import models
+from django.db.models import FloatField, Func, Value
+
+from .models import MeasurementField
+from .utils import get_measurement, get_unit_conversion
+
+__all__ = ("InUnit", "Sum", "Avg", "Min", "Max")
+
+
+def _get_measurement_field(expression, source):
+    field = source._output_field_or_none
+    if not isinstance(field, MeasurementField):
+        raise TypeError(
+            "%s() expects a MeasurementField, got %s."
+            % (expression.__class__.__name__, type(field).__name__)
+        )
+    return field
+
+
+class InUnit(Func):
+    """
+    Convert a measurement column to ``unit`` in the database.
+
+    Values are returned as plain floats and can be used in annotations,
+    filters and aggregates. ``unit`` defaults to the field's default unit.
+    """
+
+    template = "%(expressions)s"
+
+    def __init__(self, expression, unit=None, **extra):
+        super().__init__(expression, output_field=FloatField(), **extra)
+        self.unit = unit
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        c = super().resolve_expression(query, allow_joins, reuse, summarize, for_save)
+        (source,) = c.get_source_expressions()
+        field = _get_measurement_field(c, source)
+        conversion = get_unit_conversion(
+            field.measurement, c.unit or field.get_default_unit()
+        )
+        if conversion.factor is None:
+            raise ValueError(
+                "Unit %s of %s cannot be converted in the database."
+                % (conversion.unit, field.measurement.__name__)
+            )
+
+        factor, offset = field.get_storage_conversion()
+        if factor != 1:
+            source = source * Value(factor, output_field=FloatField())
+        if conversion.offset != offset:
+            source = source - Value(
+                conversion.offset - offset, output_field=FloatField()
+            )
+        if conversion.factor != 1:
+            source = source / Value(conversion.factor, output_field=FloatField())
+        c.set_source_expressions(
+            [source.resolve_expression(query, allow_joins, reuse, summarize, for_save)]
+        )
+        return c
+
+
+class MeasurementAggregateMixin:
+    """
+    Aggregate a measurement column in the database and return a measure.
+
+    Columns not holding the standard unit are converted to it row by row
+    before aggregating, so offsets are applied to every value.
+    """
+
+    def __init__(self, expression, unit=None, **extra):
+        super().__init__(expression, output_field=FloatField(), **extra)
+        self.unit = unit
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        c = super().resolve_expression(query, allow_joins, reuse, summarize, for_save)
+        source, *expressions = c.get_source_expressions()
+        field = c.measurement_field = _get_measurement_field(c, source)
+        if not field.stores_standard():
+            factor, offset = field.get_storage_conversion()
+            if factor != 1:
+                source = source * Value(factor, output_field=FloatField())
+            if offset:
+                source = source + Value(offset, output_field=FloatField())
+            c.set_source_expressions(
+                [
+                    source.resolve_expression(
+                        query, allow_joins, reuse, summarize, for_save
+                    ),
+                    *expressions,
+                ]
+            )
+        return c
+
+    def get_db_converters(self, connection):
+        return super().get_db_converters(connection) + [self.convert_measurement]
+
+    def convert_measurement(self, value, expression, connection):
+        if value is None:
+            return None
+        field = self.measurement_field
+        return get_measurement(
+            field.measurement,
+            float(value),
+            original_unit=self.unit or field.get_default_unit(),
+        )
+
+
+class Sum(MeasurementAggregateMixin, models.Sum):
+    pass
+
+
+class Avg(MeasurementAggregateMixin, models.Avg):
+    pass
+
+
+class Min(MeasurementAggregateMixin, models.Min):
+    pass
+
+
+class Max(MeasurementAggregateMixin, models.Max):
+    pass
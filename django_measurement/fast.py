@@ -0,0 +1,352 @@
+"""
+Float based implementations of common python-measurement measures.
+
+Used by ``django_measurement.backends.FloatBackend``. Each class subclasses
+the python-measurement measure it replaces, so ``isinstance`` checks and
+comparisons keep working, but holds a plain float in the standard unit and
+converts with the factors of `utils.get_conversion_table` and
+`utils.from_standard` instead of sympy expressions.
+"""
+import functools
+
+from measurement import measures
+from measurement.base import NUMERIC_TYPES, BidimensionalMeasure, pretty_name
+
+from .utils import from_standard, get_conversion_table
+
+__all__ = (
+    "FloatMeasure",
+    "FloatBidimensionalMeasure",
+    "Distance",
+    "Mass",
+    "Weight",
+    "Speed",
+    "Temperature",
+    "Volume",
+    "MEASURES",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_unit(measure, unit):
+    """
+    Return the canonical name of ``unit`` of ``measure``.
+
+    Aliases and case are resolved like python-measurement does for keyword
+    arguments; unknown units raise ``AttributeError``.
+    """
+    if issubclass(measure, BidimensionalMeasure):
+        parts = measure.ALIAS.get(unit, unit).split("__")
+        if len(parts) != 2:
+            raise AttributeError("Unknown unit type: %s" % unit)
+        return "%s__%s" % (
+            resolve_unit(measure.PRIMARY_DIMENSION, parts[0]),
+            resolve_unit(measure.REFERENCE_DIMENSION, parts[1]),
+        )
+
+    units = measure.get_units()
+    if unit in units:
+        return unit
+    aliases = measure.get_aliases()
+    if unit in aliases:
+        return aliases[unit]
+    lower = unit.lower()
+    if lower in units:
+        return lower
+    lowercase_aliases = measure.get_lowercase_aliases()
+    if lower in lowercase_aliases:
+        return lowercase_aliases[lower]
+    raise AttributeError("Unknown unit type: %s" % unit)
+
+
+def _set_unit(measure, unit):
+    try:
+        return resolve_unit(measure, unit)
+    except AttributeError:
+        raise ValueError("Invalid unit %s" % unit)
+
+
+class FloatMeasure:
+    """
+    Mixin storing a `MeasureBase` as a float in its standard unit.
+
+    ``MEASURE`` is the python-measurement class that is replaced.
+    """
+
+    MEASURE = None
+
+    def __init__(self, default_unit=None, **kwargs):
+        standard, unit = 0.0, self.STANDARD_UNIT
+        for unit, value in kwargs.items():
+            unit = resolve_unit(self.MEASURE, unit)
+            factor, offset = get_conversion_table(self.MEASURE)[unit]
+            standard = float(value) * factor + offset
+        self.__dict__.update({self.STANDARD_UNIT: standard, "_default_unit": unit})
+        if default_unit and isinstance(default_unit, str):
+            self._default_unit = default_unit
+
+    @classmethod
+    def from_unit(cls, value, unit, original_unit=None):
+        """Return a measure holding ``value`` in ``unit``, shown in ``original_unit``."""
+        unit = resolve_unit(cls.MEASURE, unit)
+        factor, offset = get_conversion_table(cls.MEASURE)[unit]
+        if original_unit:
+            unit = _set_unit(cls.MEASURE, original_unit)
+        return cls._from_standard(float(value) * factor + offset, unit)
+
+    @classmethod
+    def _from_standard(cls, standard, unit):
+        m = cls.__new__(cls)
+        m.__dict__.update({cls.STANDARD_UNIT: standard, "_default_unit": unit})
+        return m
+
+    def __getattr__(self, name):
+        try:
+            return from_standard(self.MEASURE, name, self.__dict__[self.STANDARD_UNIT])
+        except KeyError:
+            raise AttributeError("Unknown unit type: %s" % name)
+
+    @property
+    def value(self):
+        return getattr(self, self._default_unit)
+
+    @value.setter
+    def value(self, value):
+        factor, offset = get_conversion_table(self.MEASURE)[self._default_unit]
+        self.standard = value * factor + offset
+
+    @property
+    def unit(self):
+        return self._default_unit
+
+    @unit.setter
+    def unit(self, value):
+        self._default_unit = _set_unit(self.MEASURE, value)
+
+    def __eq__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self.standard == other.standard
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self.standard < other.standard
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self._from_standard(
+                self.standard + other.standard, self._default_unit
+            )
+        return super().__add__(other)
+
+    def __iadd__(self, other):
+        if isinstance(other, self.MEASURE):
+            self.standard += other.standard
+            return self
+        return super().__iadd__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self._from_standard(
+                self.standard - other.standard, self._default_unit
+            )
+        return super().__sub__(other)
+
+    def __isub__(self, other):
+        if isinstance(other, self.MEASURE):
+            self.standard -= other.standard
+            return self
+        return super().__isub__(other)
+
+    def __mul__(self, other):
+        if isinstance(other, NUMERIC_TYPES):
+            return self._from_standard(self.standard * other, self._default_unit)
+        return super().__mul__(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self.standard / other.standard
+        if isinstance(other, NUMERIC_TYPES):
+            return self._from_standard(self.standard / other, self._default_unit)
+        return super().__truediv__(other)
+
+
+class FloatBidimensionalMeasure:
+    """
+    Mixin storing a `BidimensionalMeasure` as a float in its standard unit.
+
+    Instead of nested measures, only the standard value and the
+    ``primary__reference`` unit are stored; ``primary`` and ``reference``
+    return new measures, changing them has no effect.
+    """
+
+    MEASURE = None
+
+    def __init__(self, **kwargs):
+        if "primary" in kwargs and "reference" in kwargs:
+            primary, reference = kwargs["primary"], kwargs["reference"]
+            standard = float(primary.standard) / float(reference.standard)
+            unit = "%s__%s" % (primary.unit, reference.unit)
+        else:
+            if len(kwargs) > 1:
+                raise ValueError("Only one keyword argument is expected")
+            unit, value = kwargs.popitem()
+            unit = resolve_unit(self.MEASURE, unit)
+            factor, offset = get_conversion_table(self.MEASURE)[unit]
+            standard = float(value) * factor + offset
+        self.__dict__.update({"_standard": standard, "_default_unit": unit})
+
+    from_unit = FloatMeasure.__dict__["from_unit"]
+
+    @classmethod
+    def _from_standard(cls, standard, unit):
+        m = cls.__new__(cls)
+        m.__dict__.update({"_standard": standard, "_default_unit": unit})
+        return m
+
+    def __getattr__(self, name):
+        unit = resolve_unit(self.MEASURE, name)
+        return from_standard(self.MEASURE, unit, self.__dict__["_standard"])
+
+    @property
+    def standard(self):
+        return self._standard
+
+    @standard.setter
+    def standard(self, value):
+        self._standard = value
+
+    @property
+    def value(self):
+        return getattr(self, self._default_unit)
+
+    @property
+    def unit(self):
+        return self._default_unit
+
+    @unit.setter
+    def unit(self, value):
+        self._default_unit = _set_unit(self.MEASURE, value)
+
+    @property
+    def reference(self):
+        measure = self.REFERENCE_DIMENSION
+        unit = self._default_unit.split("__")[1]
+        units = measure.get_units()
+        m = measure.__new__(measure)
+        m.__dict__.update(
+            {
+                measure.STANDARD_UNIT: float(
+                    units[unit] / units[measure.STANDARD_UNIT]
+                ),
+                "_default_unit": unit,
+            }
+        )
+        return m
+
+    @property
+    def primary(self):
+        measure = self.PRIMARY_DIMENSION
+        m = measure.__new__(measure)
+        m.__dict__.update(
+            {
+                measure.STANDARD_UNIT: self._standard * self.reference.standard,
+                "_default_unit": self._default_unit.split("__")[0],
+            }
+        )
+        return m
+
+    def __repr__(self):
+        return "%s(%s=%s)" % (pretty_name(self), self._default_unit, self.value)
+
+    def __str__(self):
+        return "%s %s" % (self.value, self._default_unit.replace("__", "/"))
+
+    __eq__ = FloatMeasure.__eq__
+    __lt__ = FloatMeasure.__lt__
+    __hash__ = None
+
+    def __add__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self._from_standard(
+                self.standard + other.standard, self._default_unit
+            )
+        return super().__add__(other)
+
+    def __iadd__(self, other):
+        if isinstance(other, self.MEASURE):
+            self._standard += other.standard
+            return self
+        return super().__iadd__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self._from_standard(
+                self.standard - other.standard, self._default_unit
+            )
+        return super().__sub__(other)
+
+    def __isub__(self, other):
+        if isinstance(other, self.MEASURE):
+            self._standard -= other.standard
+            return self
+        return super().__isub__(other)
+
+    def __mul__(self, other):
+        if isinstance(other, NUMERIC_TYPES):
+            return self._from_standard(self.standard * other, self._default_unit)
+        return super().__mul__(other)
+
+    def __imul__(self, other):
+        if isinstance(other, NUMERIC_TYPES):
+            self._standard *= float(other)
+            return self
+        return super().__imul__(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, self.MEASURE):
+            return self.standard / other.standard
+        if isinstance(other, NUMERIC_TYPES):
+            return self._from_standard(self.standard / other, self._default_unit)
+        return super().__truediv__(other)
+
+    def __itruediv__(self, other):
+        if isinstance(other, NUMERIC_TYPES):
+            self._standard /= float(other)
+            return self
+        return super().__itruediv__(other)
+
+    def __bool__(self):
+        return bool(self._standard)
+
+
+class Distance(FloatMeasure, measures.Distance):
+    MEASURE = measures.Distance
+
+
+class Mass(FloatMeasure, measures.Mass):
+    MEASURE = measures.Mass
+
+
+Weight = Mass
+
+
+class Temperature(FloatMeasure, measures.Temperature):
+    MEASURE = measures.Temperature
+
+
+class Volume(FloatMeasure, measures.Volume):
+    MEASURE = measures.Volume
+
+
+class Speed(FloatBidimensionalMeasure, measures.Speed):
+    MEASURE = measures.Speed
+
+
+MEASURES = {
+    measure.MEASURE: measure for measure in (Distance, Mass, Temperature, Volume, Speed)
+}
+"""Maps python-measurement classes to their float based implementation."""
@@ -1,11 +1,64 @@
+import functools
 from itertools import product
 
 from django import forms
-from django.core.validators import MaxValueValidator, MinValueValidator
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from measurement.base import BidimensionalMeasure, MeasureBase
 
-from django_measurement import utils
-from django_measurement.conf import settings
+from django_measurement import instrumentation, utils
+from django_measurement.conf import DjangoMeasurementConf, settings
+from django_measurement.validators import (
+    MaxMeasurementValidator,
+    MinMeasurementValidator,
+)
+
+
+@functools.lru_cache(maxsize=128)
+def get_unit_choices(measurement, bidimensional_separator="/"):
+    """
+    Return the unit choices offered for a measure class.
+
+    Choices are cached per measure class and separator, the cache is cleared
+    whenever a ``MEASUREMENT_*`` setting changes.
+    """
+    if issubclass(measurement, BidimensionalMeasure):
+        assert isinstance(bidimensional_separator, str), (
+            "Supplied bidimensional_separator for %s must be of string/unicode type;"
+            " Instead got type %s" % (measurement, str(type(bidimensional_separator)),)
+        )
+        return tuple(
+            (
+                (
+                    "{0}__{1}".format(primary, reference),
+                    "{0}{1}{2}".format(
+                        getattr(measurement.PRIMARY_DIMENSION, "LABELS", {}).get(
+                            primary, primary
+                        ),
+                        bidimensional_separator,
+                        getattr(measurement.REFERENCE_DIMENSION, "LABELS", {}).get(
+                            reference, reference
+                        ),
+                    ),
+                )
+                for primary, reference in product(
+                    measurement.PRIMARY_DIMENSION.get_units(),
+                    measurement.REFERENCE_DIMENSION.get_units(),
+                )
+            )
+        )
+    return tuple(
+        (
+            (u, getattr(measurement, "LABELS", {}).get(u, u))
+            for u in measurement.get_units()
+        )
+    )
+
+
+@receiver(setting_changed)
+def clear_unit_choices_cache(setting, **kwargs):
+    if setting.startswith(DjangoMeasurementConf._meta.prefixed_name("")):
+        get_unit_choices.cache_clear()
 
 
 class MeasurementWidget(forms.MultiWidget):
@@ -15,11 +68,15 @@ class MeasurementWidget(forms.MultiWidget):
         float_widget=None,
         unit_choices_widget=None,
         unit_choices=None,
+        preferred_units=None,
         *args,
         **kwargs
     ):
 
         self.unit_choices = unit_choices
+        self.units = tuple(u for u, n in unit_choices or ())
+        self.unit_index = frozenset(self.units)
+        self.preferred_units = tuple(preferred_units or ())
 
         if not float_widget:
             float_widget = forms.TextInput(attrs=attrs)
@@ -30,14 +87,23 @@ class MeasurementWidget(forms.MultiWidget):
         widgets = (float_widget, unit_choices_widget)
         super(MeasurementWidget, self).__init__(widgets, attrs)
 
-    def decompress(self, value):
-        if value:
-            choice_units = set([u for u, n in self.unit_choices])
+    def get_unit(self, value):
+        """
+        Return the unit ``value`` is displayed in.
 
-            unit = value.STANDARD_UNIT
-            if unit not in choice_units:
-                unit = choice_units.pop()
+        The first offered unit of ``preferred_units`` is used, then the
+        standard unit of the measure, and finally the first unit choice.
+        """
+        for unit in self.preferred_units:
+            if unit in self.unit_index:
+                return unit
+        if value.STANDARD_UNIT in self.unit_index:
+            return value.STANDARD_UNIT
+        return self.units[0]
 
+    def decompress(self, value):
+        if value:
+            unit = self.get_unit(value)
             magnitude = getattr(value, unit)
             return [magnitude, unit]
 
@@ -52,7 +118,7 @@ class MeasurementField(forms.MultiValueField):
         min_value=None,
         unit_choices=None,
         validators=None,
-        bidimensional_separator=settings.MEASUREMENT_BIDIMENSIONAL_SEPARATOR,
+        bidimensional_separator=None,
         *args,
         **kwargs
     ):
@@ -62,54 +128,24 @@ class MeasurementField(forms.MultiValueField):
 
         self.measurement_class = measurement
         if not unit_choices:
-            if issubclass(measurement, BidimensionalMeasure):
-                assert isinstance(bidimensional_separator, str), (
-                    "Supplied bidimensional_separator for %s must be of string/unicode type;"
-                    " Instead got type %s"
-                    % (measurement, str(type(bidimensional_separator)),)
-                )
-                unit_choices = tuple(
-                    (
-                        (
-                            "{0}__{1}".format(primary, reference),
-                            "{0}{1}{2}".format(
-                                getattr(
-                                    measurement.PRIMARY_DIMENSION, "LABELS", {}
-                                ).get(primary, primary),
-                                bidimensional_separator,
-                                getattr(
-                                    measurement.REFERENCE_DIMENSION, "LABELS", {}
-                                ).get(reference, reference),
-                            ),
-                        )
-                        for primary, reference in product(
-                            measurement.PRIMARY_DIMENSION.get_units(),
-                            measurement.REFERENCE_DIMENSION.get_units(),
-                        )
-                    )
-                )
-            else:
-                unit_choices = tuple(
-                    (
-                        (u, getattr(measurement, "LABELS", {}).get(u, u))
-                        for u in measurement.get_units()
-                    )
-                )
+            if bidimensional_separator is None:
+                bidimensional_separator = settings.MEASUREMENT_BIDIMENSIONAL_SEPARATOR
+            unit_choices = get_unit_choices(measurement, bidimensional_separator)
 
         if validators is None:
             validators = []
 
         if min_value is not None:
-            if not isinstance(min_value, MeasureBase):
+            if not isinstance(min_value, (MeasureBase, BidimensionalMeasure)):
                 msg = '"min_value" must be a measure, got %s' % type(min_value)
                 raise ValueError(msg)
-            validators += [MinValueValidator(min_value)]
+            validators += [MinMeasurementValidator(min_value)]
 
         if max_value is not None:
-            if not isinstance(max_value, MeasureBase):
+            if not isinstance(max_value, (MeasureBase, BidimensionalMeasure)):
                 msg = '"max_value" must be a measure, got %s' % type(max_value)
                 raise ValueError(msg)
-            validators += [MaxValueValidator(max_value)]
+            validators += [MaxMeasurementValidator(max_value)]
 
         float_field = forms.FloatField(*args, **kwargs)
         choice_field = forms.ChoiceField(choices=unit_choices)
@@ -135,3 +171,11 @@ class MeasurementField(forms.MultiValueField):
             return None
 
         return utils.get_measurement(self.measurement_class, value, unit)
+
+
+instrumentation.instrument_method(
+    MeasurementField,
+    "compress",
+    "compress",
+    lambda field, value, result: (field.measurement_class, result.unit),
+)
@@ -0,0 +1,185 @@
+"""
+Optional instrumentation of measurement conversions.
+
+With ``MEASUREMENT_INSTRUMENTATION`` enabled, the model field, the form field
+and `utils.get_measurement` send the `measurement_event` signal for every
+conversion. Instrumented methods are only wrapped while instrumentation is
+enabled; `utils.get_measurement` checks the module level ``enabled`` flag.
+
+`collect_metrics` collects the events of a block of code, and
+`MeasurementMetricsMiddleware` logs the totals of each request.
+"""
+import collections
+import contextlib
+import contextvars
+import functools
+import logging
+import threading
+import time
+
+from django.core.signals import setting_changed
+from django.dispatch import Signal, receiver
+
+__all__ = (
+    "measurement_event",
+    "Metrics",
+    "collect_metrics",
+    "MeasurementMetricsMiddleware",
+)
+
+logger = logging.getLogger("django_measurement")
+
+measurement_event = Signal()
+"""
+Sent with the measure class as sender and the keyword arguments
+``event``, ``unit`` and ``duration`` (in seconds, ``None`` for
+``guessed_unit``).
+"""
+
+EVENTS = (
+    "from_db_value",
+    "get_prep_value",
+    "to_python",
+    "get_measurement",
+    "compress",
+    "guessed_unit",
+)
+
+enabled = False
+
+_collectors = contextvars.ContextVar("collectors", default=())
+_active_collectors = 0
+_lock = threading.RLock()
+_methods = []
+
+
+def _wrap(func, event, get_unit):
+    @functools.wraps(func)
+    def wrapper(self, value, *args, **kwargs):
+        started = time.perf_counter()
+        result = func(self, value, *args, **kwargs)
+        if result is not None:
+            record(event, *get_unit(self, value, result), started=started)
+        return result
+
+    return wrapper
+
+
+def _install(cls, name, func, event, get_unit):
+    if enabled:
+        setattr(cls, name, _wrap(func, event, get_unit))
+    else:
+        setattr(cls, name, func)
+
+
+def instrument_method(cls, name, event, get_unit):
+    """
+    Send ``event`` for calls of the method ``name`` of ``cls`` while enabled.
+
+    The method takes a value as first argument; calls returning ``None`` are
+    not reported. ``get_unit(instance, value, result)`` returns the measure class
+    and unit reported with the event.
+    """
+    with _lock:
+        method = (cls, name, cls.__dict__[name], event, get_unit)
+        _methods.append(method)
+        _install(*method)
+
+
+def refresh():
+    """Update ``enabled`` from the settings and the active collectors."""
+    from .conf import settings
+
+    global enabled
+    with _lock:
+        value = bool(settings.MEASUREMENT_INSTRUMENTATION or _active_collectors)
+        if value != enabled:
+            enabled = value
+            for method in _methods:
+                _install(*method)
+
+
+@receiver(setting_changed)
+def refresh_instrumentation(setting, **kwargs):
+    if setting == "MEASUREMENT_INSTRUMENTATION":
+        refresh()
+
+
+def record(event, measure, unit=None, started=None):
+    duration = None if started is None else time.perf_counter() - started
+    measurement_event.send(sender=measure, event=event, unit=unit, duration=duration)
+
+
+class Metrics:
+    """
+    Totals of measurement events.
+
+    ``counts`` and ``durations`` map events to their number and cumulative
+    time in seconds; durations of nested events are included in both.
+    ``units`` counts ``(measure name, unit)`` pairs.
+    """
+
+    def __init__(self):
+        self.counts = collections.Counter()
+        self.durations = collections.Counter()
+        self.units = collections.Counter()
+
+    @property
+    def warnings(self):
+        """Number of numbers whose unit was guessed by `MeasurementField.to_python`."""
+        return self.counts["guessed_unit"]
+
+    def add(self, event, measure, unit=None, duration=None):
+        self.counts[event] += 1
+        if duration is not None:
+            self.durations[event] += duration
+        if unit is not None:
+            self.units[measure.__name__, unit] += 1
+
+    def __str__(self):
+        return ", ".join(
+            "%s: %d in %.3fms" % (event, count, self.durations[event] * 1000)
+            for event, count in sorted(self.counts.items())
+        )
+
+
+@receiver(measurement_event)
+def _collect(sender, event, unit=None, duration=None, **kwargs):
+    for metrics in _collectors.get():
+        metrics.add(event, sender, unit, duration)
+
+
+@contextlib.contextmanager
+def collect_metrics():
+    """
+    Collect the measurement events of the block in a `Metrics` object.
+
+    Instrumentation is enabled while any collector is active.
+    """
+    global _active_collectors
+    metrics = Metrics()
+    token = _collectors.set(_collectors.get() + (metrics,))
+    with _lock:
+        _active_collectors += 1
+        refresh()
+    try:
+        yield metrics
+    finally:
+        _collectors.reset(token)
+        with _lock:
+            _active_collectors -= 1
+            refresh()
+
+
+class MeasurementMetricsMiddleware:
+    """Log the measurement metrics of each request at ``DEBUG`` level."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        if metrics.counts:
+            logger.debug("Measurements for %s: %s", request.path, metrics)
+        return response
@@ -0,0 +1,145 @@
+"""Lazily constructed measurement values."""
+import operator
+
+from .utils import get_measurement
+
+__all__ = ("LazyMeasurement",)
+
+
+def _proxy_method(func):
+    def inner(self, *args):
+        return func(self._setup(), *args)
+
+    return inner
+
+
+def _unpickle_lazy_measurement(wrapped):
+    return wrapped
+
+
+class LazyMeasurement:
+    """
+    Float backed stand-in for a measure loaded from the database.
+
+    Only the stored standard value, the measure class and the display unit
+    are kept. The real measure is built the first time a unit attribute is
+    read or arithmetic is performed; ``float()``, ``standard``, truth testing
+    and comparisons are served from the stored value.
+
+    Like Django's ``LazyObject``, ``__class__`` reports the wrapped measure
+    class, so ``isinstance`` checks and the operators of real measures accept
+    lazy values as well.
+    """
+
+    __slots__ = ("_measure", "_standard", "_unit", "_wrapped", "_cache")
+
+    def __init__(self, measure, standard, unit=None):
+        object.__setattr__(self, "_measure", measure)
+        object.__setattr__(self, "_standard", standard)
+        object.__setattr__(self, "_unit", unit)
+        object.__setattr__(self, "_wrapped", None)
+        object.__setattr__(self, "_cache", None)
+
+    def _setup(self):
+        if self._wrapped is None:
+            wrapped = get_measurement(
+                measure=self._measure, value=self._standard, original_unit=self._unit,
+            )
+            object.__setattr__(self, "_wrapped", wrapped)
+        return self._wrapped
+
+    __class__ = property(operator.attrgetter("_measure"))
+
+    @property
+    def standard(self):
+        if self._wrapped is None:
+            return self._standard
+        return self._wrapped.standard
+
+    @property
+    def unit(self):
+        if self._wrapped is None and self._unit:
+            return self._unit
+        return self._setup().unit
+
+    def __getattr__(self, name):
+        wrapped = self._setup()
+        # The wrapped measure can be changed without going through the proxy,
+        # e.g. after in-place arithmetic, so the cache is keyed by its state.
+        key = (wrapped.standard, wrapped.unit)
+        cache = self._cache
+        if cache is None or cache[0] != key:
+            cache = (key, {})
+            object.__setattr__(self, "_cache", cache)
+        values = cache[1]
+        if name in values:
+            return values[name]
+        value = getattr(wrapped, name)
+        if isinstance(value, float):
+            values[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._setup(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._setup(), name)
+
+    def __reduce__(self):
+        if self._wrapped is None:
+            return type(self), (self._measure, self._standard, self._unit)
+        return _unpickle_lazy_measurement, (self._wrapped,)
+
+    def __float__(self):
+        return float(self.standard)
+
+    def __bool__(self):
+        return bool(self.standard)
+
+    def __eq__(self, other):
+        if isinstance(other, self._measure):
+            return self.standard == other.standard
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, self._measure):
+            return self.standard < other.standard
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, self._measure):
+            return self.standard <= other.standard
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, self._measure):
+            return self.standard > other.standard
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, self._measure):
+            return self.standard >= other.standard
+        return NotImplemented
+
+    __hash__ = None
+
+    __repr__ = _proxy_method(repr)
+    __str__ = _proxy_method(str)
+
+    __add__ = _proxy_method(operator.add)
+    __sub__ = _proxy_method(operator.sub)
+    __mul__ = _proxy_method(operator.mul)
+    __truediv__ = _proxy_method(operator.truediv)
+    __iadd__ = _proxy_method(operator.iadd)
+    __isub__ = _proxy_method(operator.isub)
+    __imul__ = _proxy_method(operator.imul)
+    __itruediv__ = _proxy_method(operator.itruediv)
+
+    def __radd__(self, other):
+        return other + self._setup()
+
+    def __rsub__(self, other):
+        return other - self._setup()
+
+    def __rmul__(self, other):
+        return other * self._setup()
@@ -0,0 +1,96 @@
+"""
+Lookups of `MeasurementField`.
+
+Measure constants are converted to the stored column values once, when the
+lookup is created, so the database compares plain numbers with the column
+and can use an index on it.
+"""
+from django.db.models import lookups
+from measurement.base import BidimensionalMeasure, MeasureBase
+
+from .utils import get_measurement
+
+__all__ = (
+    "Exact",
+    "GreaterThan",
+    "GreaterThanOrEqual",
+    "LessThan",
+    "LessThanOrEqual",
+    "In",
+    "Range",
+    "BetweenUnits",
+)
+
+
+class MeasurementLookupMixin:
+    def check_value(self, value):
+        measure = self.lhs.output_field.measurement
+        if isinstance(value, (BidimensionalMeasure, MeasureBase)) and not isinstance(
+            value, measure
+        ):
+            raise ValueError(
+                "The '%s' lookup on a %s field got a %s value."
+                % (self.lookup_name, measure.__name__, value.__class__.__name__)
+            )
+        return value
+
+    def get_prep_lookup(self):
+        if not hasattr(self.rhs, "resolve_expression"):
+            if isinstance(self, lookups.FieldGetDbPrepValueIterableMixin):
+                for value in self.rhs:
+                    self.check_value(value)
+            else:
+                self.check_value(self.rhs)
+        return super().get_prep_lookup()
+
+
+class Exact(MeasurementLookupMixin, lookups.Exact):
+    pass
+
+
+class GreaterThan(MeasurementLookupMixin, lookups.GreaterThan):
+    pass
+
+
+class GreaterThanOrEqual(MeasurementLookupMixin, lookups.GreaterThanOrEqual):
+    pass
+
+
+class LessThan(MeasurementLookupMixin, lookups.LessThan):
+    pass
+
+
+class LessThanOrEqual(MeasurementLookupMixin, lookups.LessThanOrEqual):
+    pass
+
+
+class In(MeasurementLookupMixin, lookups.In):
+    pass
+
+
+class Range(MeasurementLookupMixin, lookups.Range):
+    pass
+
+
+class BetweenUnits(Range):
+    """
+    Filter values between two numbers given in a unit of the measure.
+
+    The right hand side is a ``(low, high, unit)`` tuple, ``unit`` defaults to
+    the field's default unit when omitted.
+    """
+
+    lookup_name = "between_units"
+
+    def get_prep_lookup(self):
+        if not hasattr(self.rhs, "resolve_expression"):
+            field = self.lhs.output_field
+            try:
+                low, high, unit = self.rhs
+            except ValueError:
+                (low, high), unit = self.rhs, field.get_default_unit()
+            self.rhs = (
+                get_measurement(field.measurement, low, unit),
+                get_measurement(field.measurement, high, unit),
+            )
+        return super().get_prep_lookup()
@@ -0,0 +1,51 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_measurement.columnar import CHUNK_SIZE, FORMATS, export_column
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a measurement field converted to a unit to a .npy, Arrow or"
+        " Parquet file, for memory-mapped access."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model to export, as app_label.ModelName.")
+        parser.add_argument("field", help="Measurement field to export.")
+        parser.add_argument("output", help="File to write to.")
+        parser.add_argument(
+            "--unit", help="Unit to convert to, defaults to the standard unit."
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="File format, defaults to the one matching the file extension.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=CHUNK_SIZE,
+            help="Number of rows fetched from the database at once.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+
+        queryset = model._default_manager.order_by(model._meta.pk.name)
+        try:
+            count = export_column(
+                queryset,
+                options["field"],
+                options["output"],
+                unit=options["unit"],
+                format=options["format"],
+                chunk_size=options["chunk_size"],
+            )
+        except (ImportError, ValueError, AttributeError) as e:
+            raise CommandError(str(e))
+        if options["verbosity"] >= 1:
+            self.stdout.write("Exported %d rows." % count)
@@ -0,0 +1,56 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_measurement.bulk import FORMATS, export_measurements
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream the rows of a model with measurement fields to CSV or NDJSON;"
+        " measurements are written as value:unit."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model to export, as app_label.ModelName.")
+        parser.add_argument(
+            "--fields", help="Comma separated field names, defaults to all fields."
+        )
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument(
+            "-o", "--output", help="File to write to, defaults to standard output."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of rows fetched from the database at once.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+
+        fields = options["fields"].split(",") if options["fields"] else None
+        queryset = model._default_manager.order_by(model._meta.pk.name)
+        output = options["output"]
+        if output:
+            stream = open(output, "w", newline="")
+        else:
+            stream = self.stdout
+            # Rows already end with a line break.
+            stream.ending = ""
+        try:
+            count = export_measurements(
+                queryset,
+                stream,
+                fields=fields,
+                format=options["format"],
+                chunk_size=options["chunk_size"],
+            )
+        finally:
+            if output:
+                stream.close()
+        if output and options["verbosity"] >= 1:
+            self.stdout.write("Exported %d rows." % count)
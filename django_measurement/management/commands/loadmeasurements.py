@@ -0,0 +1,69 @@
+import os
+import sys
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_measurement.bulk import EXTENSIONS, FORMATS, import_measurements
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream rows from CSV or NDJSON into a model with measurement fields,"
+        " using bulk_create or bulk_update in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model to import, as app_label.ModelName.")
+        parser.add_argument("input", help="File to read, '-' for standard input.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help=(
+                "Input format, guessed from the file extension by default;"
+                " standard input is read as CSV."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of objects saved per query.",
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Update existing objects by primary key instead of creating them.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+
+        path = options["input"]
+        format = options["format"]
+        if format is None and path == "-":
+            format = "csv"
+        elif format is None:
+            format = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+            if format is None:
+                raise CommandError(
+                    "Cannot guess the format of %s, pass --format." % path
+                )
+
+        stream = sys.stdin if path == "-" else open(path, newline="")
+        try:
+            count = import_measurements(
+                model,
+                stream,
+                format=format,
+                batch_size=options["batch_size"],
+                update=options["update"],
+            )
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        if options["verbosity"] >= 1:
+            self.stdout.write("Imported %d rows." % count)
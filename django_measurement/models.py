@@ -1,16 +1,128 @@
+import contextlib
+import contextvars
+import decimal
 import logging
 import warnings
 
-from django.db.models import FloatField
+import django
+from django.db.models import CharField, FloatField
+from django.db.models.query_utils import DeferredAttribute
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
-from measurement import measures
 from measurement.base import BidimensionalMeasure, MeasureBase
 
-from . import forms
-from .utils import get_measurement
+from . import instrumentation, lookups
+from .compact import CompactMeasurement
+from .conf import settings
+from .lazy import LazyMeasurement
+from .utils import get_conversion_table, get_measurement, get_unit_conversion
 
 logger = logging.getLogger("django_measurement")
 
+STORAGE_TYPES = {
+    "float": "FloatField",
+    "decimal": "DecimalField",
+    "integer": "IntegerField",
+    "biginteger": "BigIntegerField",
+}
+
+_trusted_floats = contextvars.ContextVar("trusted_floats", default=False)
+
+
+@contextlib.contextmanager
+def trusted_floats():
+    """
+    Interpret numbers assigned to any measurement field in its default unit.
+
+    Within the block, all fields behave as if declared with ``trusted_floats=True``.
+    """
+    token = _trusted_floats.set(True)
+    try:
+        yield
+    finally:
+        _trusted_floats.reset(token)
+
+
+class StoredUnitDescriptor(DeferredAttribute):
+    """
+    Descriptor of the unit column of a ``MeasurementField(store_unit=True)``.
+
+    Loading the unit applies it to a value loaded before it.
+    """
+
+    def __init__(self, field):
+        # DeferredAttribute takes the field name before Django 3.0.
+        super(StoredUnitDescriptor, self).__init__(
+            field if django.VERSION >= (3, 0) else field.attname
+        )
+        self.unit_field = field
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.unit_field.attname] = value
+        value_field = self.unit_field.value_field
+        if value_field is not None and instance.__dict__.pop(
+            value_field.pending_unit_key, False
+        ):
+            value_field.apply_stored_unit(instance)
+
+
+class StoredValueDescriptor(DeferredAttribute):
+    """
+    Descriptor of the value column of a ``MeasurementField(store_unit=True)``.
+
+    Values set while an instance is loaded wait for the unit column; if it is
+    deferred, it is loaded when the value is read. Assigned values are kept
+    as they are.
+    """
+
+    def __init__(self, field):
+        # DeferredAttribute takes the field name before Django 3.0.
+        super(StoredValueDescriptor, self).__init__(
+            field if django.VERSION >= (3, 0) else field.attname
+        )
+        self.value_field = field
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        field = self.value_field
+        data = instance.__dict__
+        if field.attname not in data:
+            instance.refresh_from_db(fields=[field.attname, field.unit_field.attname])
+        elif field.pending_unit_key in data:
+            getattr(instance, field.unit_field.attname)
+        return data[field.attname]
+
+    def __set__(self, instance, value):
+        field = self.value_field
+        data = instance.__dict__
+        data[field.attname] = value
+        if instance._state.adding and field.unit_field.attname not in data:
+            data[field.pending_unit_key] = True
+        else:
+            data.pop(field.pending_unit_key, None)
+
+
+class MeasurementUnitField(CharField):
+    """
+    Unit column of a ``MeasurementField(store_unit=True)``.
+
+    The field is added by the measurement field itself and holds the
+    canonical name of the unit the value was assigned in.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.value_field = None
+        kwargs.setdefault("max_length", 64)
+        super(MeasurementUnitField, self).__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        # Migration states contain the field already added by the measurement field.
+        if any(field.name == name for field in cls._meta.local_fields):
+            return
+        super(MeasurementUnitField, self).contribute_to_class(cls, name, **kwargs)
+        setattr(cls, self.attname, StoredUnitDescriptor(self))
+
 
 class MeasurementField(FloatField):
     description = "Easily store, retrieve, and convert python measures."
@@ -32,6 +144,15 @@ class MeasurementField(FloatField):
         measurement=None,
         measurement_class=None,
         unit_choices=None,
+        lazy=None,
+        compact=False,
+        trusted_floats=False,
+        storage_unit=None,
+        storage_type="float",
+        storage_scale=0,
+        max_digits=None,
+        decimal_places=None,
+        store_unit=False,
         *args,
         **kwargs
     ):
@@ -40,6 +161,8 @@ class MeasurementField(FloatField):
             warnings.warn(
                 '"measurement_class" will be removed in version 4.0', DeprecationWarning
             )
+            from measurement import measures
+
             measurement = getattr(measures, measurement_class)
 
         if not measurement:
@@ -54,7 +177,31 @@ class MeasurementField(FloatField):
                 " It has to be a valid MeasureBase subclass."
             )
 
+        if storage_type not in STORAGE_TYPES:
+            raise ValueError(
+                "MeasurementField() storage_type must be one of: %s."
+                % ", ".join(STORAGE_TYPES)
+            )
+
+        if storage_type == "decimal" and (max_digits is None or decimal_places is None):
+            raise TypeError(
+                'MeasurementField() with storage_type "decimal" takes'
+                " max_digits and decimal_places keyword arguments."
+            )
+
         self.measurement = measurement
+        self.storage_unit = storage_unit
+        self.storage_type = storage_type
+        self.storage_scale = storage_scale
+        self.max_digits = max_digits
+        self.decimal_places = decimal_places
+        self.lazy = lazy
+        self.compact = compact
+        self.trusted_floats = trusted_floats
+        self.store_unit = store_unit
+        self.unit_field = None
+        self.guessed_unit_count = 0
+        self._trusted_warned = False
         self.widget_args = {
             "measurement": measurement,
             "unit_choices": unit_choices,
@@ -65,8 +212,118 @@ class MeasurementField(FloatField):
     def deconstruct(self):
         name, path, args, kwargs = super(MeasurementField, self).deconstruct()
         kwargs["measurement"] = self.measurement
+        if self.lazy is not None:
+            kwargs["lazy"] = self.lazy
+        if self.compact:
+            kwargs["compact"] = True
+        if self.trusted_floats:
+            kwargs["trusted_floats"] = True
+        if self.storage_unit is not None:
+            kwargs["storage_unit"] = self.storage_unit
+        if self.storage_type != "float":
+            kwargs["storage_type"] = self.storage_type
+        if self.storage_scale:
+            kwargs["storage_scale"] = self.storage_scale
+        if self.max_digits is not None:
+            kwargs["max_digits"] = self.max_digits
+        if self.decimal_places is not None:
+            kwargs["decimal_places"] = self.decimal_places
+        if self.store_unit:
+            kwargs["store_unit"] = True
         return name, path, args, kwargs
 
+    def contribute_to_class(self, cls, name, **kwargs):
+        super(MeasurementField, self).contribute_to_class(cls, name, **kwargs)
+        if self.store_unit and not cls._meta.abstract:
+            self.unit_field = MeasurementUnitField(
+                editable=False, null=True, blank=True
+            )
+            self.unit_field.value_field = self
+            cls.add_to_class("%s_unit" % name, self.unit_field)
+            setattr(cls, self.attname, StoredValueDescriptor(self))
+
+    @property
+    def pending_unit_key(self):
+        return "_%s_pending_unit" % self.attname
+
+    def get_stored_unit(self, value):
+        """Return the unit stored for ``value``, ``None`` if it is not a measure."""
+        if isinstance(value, self.MEASURE_BASES):
+            unit = value.unit
+            if unit in get_conversion_table(self.measurement):
+                return unit
+
+    def apply_stored_unit(self, instance):
+        """Show the loaded value of ``instance`` in its stored unit."""
+        value = instance.__dict__.get(self.attname)
+        unit = instance.__dict__.get(self.unit_field.attname)
+        if unit not in get_conversion_table(self.measurement):
+            unit = None
+        if type(value) is LazyMeasurement and value._wrapped is None:
+            # Loaded values are built here, once, in the stored unit.
+            instance.__dict__[self.attname] = self._from_standard(
+                value._standard, unit or value._unit
+            )
+        elif isinstance(value, CompactMeasurement):
+            if unit:
+                value.unit = unit
+        elif unit and isinstance(value, self.MEASURE_BASES) and value.unit != unit:
+            instance.__dict__[self.attname] = self._from_standard(
+                float(value.standard), unit
+            )
+
+    def pre_save(self, model_instance, add):
+        value = super(MeasurementField, self).pre_save(model_instance, add)
+        if self.unit_field is not None:
+            model_instance.__dict__[self.unit_field.attname] = self.get_stored_unit(
+                value
+            )
+        return value
+
+    def get_internal_type(self):
+        return STORAGE_TYPES[self.storage_type]
+
+    def stores_standard(self):
+        """Whether the column holds plain floats in the measure's standard unit."""
+        return (
+            self.storage_type == "float"
+            and not self.storage_scale
+            and self.storage_unit in (None, self.measurement.STANDARD_UNIT)
+        )
+
+    def get_storage_conversion(self):
+        """
+        Return ``(factor, offset)`` converting column values to the standard unit.
+
+        Values are converted with ``standard = column * factor + offset``.
+        """
+        factor, offset = 1.0, 0.0
+        if self.storage_unit is not None:
+            conversion = get_unit_conversion(self.measurement, self.storage_unit)
+            if conversion.factor is None:
+                raise ValueError(
+                    "Unit %s of %s cannot be used as storage unit."
+                    % (conversion.unit, self.measurement.__name__)
+                )
+            factor, offset = conversion.factor, conversion.offset
+        return factor / 10 ** self.storage_scale, offset
+
+    @cached_property
+    def context(self):
+        return decimal.Context(prec=self.max_digits)
+
+    def to_column(self, value):
+        """Return the number stored in the column for a plain number."""
+        if self.storage_type == "float":
+            return float(value)
+        if self.storage_type == "decimal":
+            if isinstance(value, float):
+                value = self.context.create_decimal_from_float(value)
+            else:
+                value = self.context.create_decimal(value)
+            return value.quantize(decimal.Decimal(1).scaleb(-self.decimal_places))
+        return int(round(value))
+
     def get_prep_value(self, value):
         if value is None:
             return None
@@ -75,26 +332,59 @@ class MeasurementField(FloatField):
             # sometimes we get sympy.core.numbers.Float, which the
             # database does not understand, so explicitely convert to
             # float
+            standard = float(value.standard)
+            if self.stores_standard():
+                return standard
+            factor, offset = self.get_storage_conversion()
+            return self.to_column((standard - offset) / factor)
 
-            return float(value.standard)
+        elif self.storage_type != "float":
+            return self.to_column(value)
 
         else:
             return super(MeasurementField, self).get_prep_value(value)
 
+    def get_db_prep_save(self, value, connection):
+        value = super(MeasurementField, self).get_db_prep_save(value, connection)
+        if self.storage_type == "decimal":
+            return connection.ops.adapt_decimalfield_value(
+                value, self.max_digits, self.decimal_places
+            )
+        return value
+
     def get_default_unit(self):
         unit_choices = self.widget_args["unit_choices"]
         if unit_choices:
             return unit_choices[0][0]
         return self.measurement.STANDARD_UNIT
 
+    def is_lazy(self):
+        if self.lazy is None:
+            return settings.MEASUREMENT_LAZY_LOAD
+        return self.lazy
+
     def from_db_value(self, value, *args, **kwargs):
         if value is None:
             return None
 
+        if not self.stores_standard():
+            factor, offset = self.get_storage_conversion()
+            value = float(value) * factor + offset
+
+        if self.unit_field is not None and not self.compact:
+            # Values of store_unit fields are built once their unit is loaded.
+            return LazyMeasurement(self.measurement, value, self.get_default_unit())
+        return self._from_standard(value, self.get_default_unit())
+
+    def _from_standard(self, value, unit):
+        if self.compact:
+            return CompactMeasurement(self.measurement, value, unit)
+
+        if self.is_lazy():
+            return LazyMeasurement(self.measurement, value, unit)
+
         return get_measurement(
-            measure=self.measurement,
-            value=value,
-            original_unit=self.get_default_unit(),
+            measure=self.measurement, value=value, original_unit=unit,
         )
 
     def value_to_string(self, obj):
@@ -117,30 +407,82 @@ class MeasurementField(FloatField):
             return value
         elif isinstance(value, self.MEASURE_BASES):
             return value
+        elif isinstance(value, (int, float)) and (
+            self.trusted_floats or _trusted_floats.get()
+        ):
+            return self._from_default_unit(float(value), trusted=True)
         elif isinstance(value, str):
             parsed = self.deserialize_value_from_string(value)
             if parsed is not None:
                 return parsed
         value = super(MeasurementField, self).to_python(value)
+        return self._from_default_unit(value)
 
+    def _from_default_unit(self, value, trusted=False):
         return_unit = self.get_default_unit()
+        self.guessed_unit_count += 1
 
-        msg = (
-            'You assigned a %s instead of %s to %s.%s.%s, unit was guessed to be "%s".'
-            % (
+        if instrumentation.enabled:
+            instrumentation.record("guessed_unit", self.measurement, return_unit)
+
+        warn = not (trusted and self._trusted_warned)
+        if trusted:
+            self._trusted_warned = True
+        if warn:
+            logger.warning(
+                'You assigned a %s instead of %s to %s.%s.%s, unit was guessed to be "%s".',
                 type(value).__name__,
-                str(self.measurement.__name__),
+                self.measurement.__name__,
                 self.model.__module__,
                 self.model.__name__,
                 self.name,
                 return_unit,
             )
-        )
-        logger.warning(msg)
         return get_measurement(measure=self.measurement, value=value, unit=return_unit,)
 
     def formfield(self, **kwargs):
+        from . import forms
+
         defaults = {"form_class": forms.MeasurementField}
         defaults.update(kwargs)
         defaults.update(self.widget_args)
         return super(MeasurementField, self).formfield(**defaults)
+
+
+for lookup in (
+    lookups.Exact,
+    lookups.GreaterThan,
+    lookups.GreaterThanOrEqual,
+    lookups.LessThan,
+    lookups.LessThanOrEqual,
+    lookups.In,
+    lookups.Range,
+    lookups.BetweenUnits,
+):
+    MeasurementField.register_lookup(lookup)
+
+
+def _get_unit(value):
+    if isinstance(value, MeasurementField.MEASURE_BASES):
+        return value.unit
+
+
+instrumentation.instrument_method(
+    MeasurementField,
+    "from_db_value",
+    "from_db_value",
+    lambda field, value, result: (field.measurement, _get_unit(result)),
+)
+instrumentation.instrument_method(
+    MeasurementField,
+    "get_prep_value",
+    "get_prep_value",
+    lambda field, value, result: (field.measurement, _get_unit(value)),
+)
+instrumentation.instrument_method(
+    MeasurementField,
+    "to_python",
+    "to_python",
+    lambda field, value, result: (field.measurement, _get_unit(result)),
+)
+instrumentation.refresh()
@@ -0,0 +1,86 @@
+"""Migration operations for measurement fields."""
+from django.db import router
+from django.db.migrations.operations.base import Operation
+
+from .query import convert_unit
+
+__all__ = ("ConvertMeasurementUnit",)
+
+
+class ConvertMeasurementUnit(Operation):
+    """
+    Convert the stored values of a measurement field to another storage unit.
+
+    Values are rewritten with ``UPDATE`` statements, in primary key ranges of
+    ``batch_size`` if given. Reversing the operation converts them back.
+    The operation does not change the model state; combine it with the
+    ``AlterField`` operation that changes ``storage_unit`` or ``storage_scale``.
+    """
+
+    reversible = True
+    reduces_to_sql = False
+
+    def __init__(
+        self,
+        model_name,
+        name,
+        from_unit=None,
+        to_unit=None,
+        from_scale=0,
+        to_scale=0,
+        batch_size=None,
+    ):
+        self.model_name = model_name
+        self.name = name
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.from_scale = from_scale
+        self.to_scale = to_scale
+        self.batch_size = batch_size
+
+    def deconstruct(self):
+        kwargs = {"model_name": self.model_name, "name": self.name}
+        for attr in ("from_unit", "to_unit", "batch_size"):
+            if getattr(self, attr) is not None:
+                kwargs[attr] = getattr(self, attr)
+        for attr in ("from_scale", "to_scale"):
+            if getattr(self, attr):
+                kwargs[attr] = getattr(self, attr)
+        return self.__class__.__name__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _convert(self, app_label, schema_editor, state, reverse=False):
+        model = state.apps.get_model(app_label, self.model_name)
+        if not router.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        units = (self.from_unit, self.to_unit)
+        scales = (self.from_scale, self.to_scale)
+        if reverse:
+            units, scales = units[::-1], scales[::-1]
+        convert_unit(
+            model._base_manager.using(schema_editor.connection.alias),
+            self.name,
+            *units,
+            *scales,
+            batch_size=self.batch_size,
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self._convert(app_label, schema_editor, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        self._convert(app_label, schema_editor, from_state, reverse=True)
+
+    def describe(self):
+        return "Convert %s.%s from %s to %s" % (
+            self.model_name,
+            self.name,
+            self.from_unit or "the standard unit",
+            self.to_unit or "the standard unit",
+        )
+
+    @property
+    def migration_name_fragment(self):
+        return "convert_%s_%s" % (self.model_name.lower(), self.name.lower())
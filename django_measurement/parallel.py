@@ -0,0 +1,126 @@
+"""
+Conversion of large amounts of measurements in a process pool.
+
+Input is split into chunks that are sent to worker processes as arrays of
+floats and unit ids with a small table of unit names, instead of pickled
+measure objects. Results are returned in input order.
+"""
+import collections
+import concurrent.futures
+import itertools
+import os
+from array import array
+
+from .utils import get_measurement, get_unit_conversion
+
+__all__ = ("iter_convert", "convert", "convert_queryset")
+
+CHUNK_SIZE = 100000
+
+
+def _get_scale(conversion, target):
+    if conversion.factor is None or target.factor is None:
+        return None
+    return (
+        conversion.factor / target.factor,
+        (conversion.offset - target.offset) / target.factor,
+    )
+
+
+def _convert_chunk(measure, units, values, unit_ids, to_unit):
+    target = get_unit_conversion(measure, to_unit)
+    scales = [_get_scale(get_unit_conversion(measure, u), target) for u in units]
+    result = array("d", values)
+    for i, (value, unit_id) in enumerate(zip(values, unit_ids)):
+        scale = scales[unit_id]
+        if scale is None:
+            m = get_measurement(measure, value, units[unit_id])
+            result[i] = getattr(m, target.unit)
+        else:
+            result[i] = value * scale[0] + scale[1]
+    return result
+
+
+def _encode_chunk(pairs):
+    units = {}
+    values = array("d")
+    unit_ids = array("L")
+    for value, unit in pairs:
+        values.append(value)
+        unit_ids.append(units.setdefault(unit, len(units)))
+    return tuple(units), values, unit_ids
+
+
+def iter_convert(
+    measure,
+    pairs,
+    to_unit=None,
+    chunk_size=CHUNK_SIZE,
+    executor=None,
+    max_workers=None,
+):
+    """
+    Yield the magnitudes of ``(value, unit)`` ``pairs`` converted to ``to_unit``.
+
+    Units default to the standard unit of ``measure``. Chunks of ``chunk_size``
+    pairs are converted in ``executor``, or in a new process pool with
+    ``max_workers`` processes; at most two chunks per worker are in flight.
+    """
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            yield from iter_convert(
+                measure, pairs, to_unit, chunk_size, executor, max_workers
+            )
+        return
+
+    pairs = iter(pairs)
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    pending = collections.deque()
+    while True:
+        while len(pending) < window:
+            chunk = list(itertools.islice(pairs, chunk_size))
+            if not chunk:
+                break
+            units, values, unit_ids = _encode_chunk(chunk)
+            pending.append(
+                executor.submit(
+                    _convert_chunk, measure, units, values, unit_ids, to_unit
+                )
+            )
+        if not pending:
+            return
+        yield from pending.popleft().result()
+
+
+def convert(measure, pairs, to_unit=None, **kwargs):
+    """Return `iter_convert` results as an array of floats."""
+    return array("d", iter_convert(measure, pairs, to_unit, **kwargs))
+
+
+def convert_queryset(
+    queryset, field_name, to_unit=None, chunk_size=CHUNK_SIZE, **kwargs
+):
+    """
+    Yield ``(pk, value)`` for the non-null values of ``field_name`` in ``to_unit``.
+
+    ``to_unit`` defaults to the field's default unit. Stored values are read in
+    the standard unit and converted like `iter_convert`.
+    """
+    # Imported here so worker processes do not need configured Django settings.
+    from .query import annotate_in_units
+
+    field = queryset.model._meta.get_field(field_name)
+    measure = field.measurement
+    queryset, fields = annotate_in_units(
+        queryset.filter(**{"%s__isnull" % field_name: False}),
+        ["pk", field_name],
+        {field_name: measure.STANDARD_UNIT},
+    )
+    rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+    rows, pks = itertools.tee(rows)
+    pairs = ((value, None) for pk, value in rows)
+    values = iter_convert(
+        measure, pairs, to_unit or field.get_default_unit(), chunk_size, **kwargs
+    )
+    for (pk, _), value in zip(pks, values):
+        yield pk, value
@@ -0,0 +1,138 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models.functions import Round
+
+from .expressions import InUnit
+from .models import MeasurementField
+from .utils import get_unit_conversion
+
+__all__ = ("MeasurementQuerySet", "MeasurementManager")
+
+
+def get_measurement_fields(model, fields):
+    """Return ``(name, field)`` pairs of the measurement fields among ``fields``."""
+    for name in fields:
+        if not isinstance(name, str):
+            continue
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if isinstance(field, MeasurementField):
+            yield name, field
+
+
+def annotate_in_units(queryset, fields=None, unit=None):
+    """
+    Replace measurement ``fields`` of ``queryset`` by plain floats in ``unit``.
+
+    Return the annotated queryset and the field names, for use with
+    ``values()`` or ``values_list()``. ``fields`` defaults to all concrete fields.
+    """
+    if not fields:
+        fields = [f.attname for f in queryset.model._meta.concrete_fields]
+
+    clone = queryset._chain()
+    for name, field in get_measurement_fields(queryset.model, fields):
+        field_unit = unit.get(name) if isinstance(unit, dict) else unit
+        clone.query.add_annotation(InUnit(name, field_unit), name)
+    return clone, list(fields)
+
+
+def get_unit_change(measure, from_unit=None, to_unit=None, from_scale=0, to_scale=0):
+    """
+    Return ``(factor, offset)`` converting column values between storage units.
+
+    Values stored in ``from_unit`` times ``10 ** from_scale`` are converted to
+    ``to_unit`` times ``10 ** to_scale`` with ``value * factor + offset``.
+    Units default to the standard unit of ``measure``.
+    """
+    scales = []
+    for unit, scale in ((from_unit, from_scale), (to_unit, to_scale)):
+        conversion = get_unit_conversion(measure, unit)
+        if conversion.factor is None:
+            raise ValueError(
+                "Unit %s of %s cannot be converted with a linear function."
+                % (conversion.unit, measure.__name__)
+            )
+        scales.append((conversion.factor / 10 ** scale, conversion.offset))
+    (from_factor, from_offset), (to_factor, to_offset) = scales
+    return from_factor / to_factor, (from_offset - to_offset) / to_factor
+
+
+def convert_unit(
+    queryset,
+    field_name,
+    from_unit=None,
+    to_unit=None,
+    from_scale=0,
+    to_scale=0,
+    batch_size=None,
+):
+    """
+    Convert the stored values of ``field_name`` with ``UPDATE`` statements.
+
+    Return the number of updated rows. With ``batch_size``, rows are updated
+    in primary key ranges of that size; this requires an integer primary key.
+    """
+    field = queryset.model._meta.get_field(field_name)
+    factor, offset = get_unit_change(
+        field.measurement, from_unit, to_unit, from_scale, to_scale
+    )
+    if factor == 1 and offset == 0:
+        return 0
+
+    value = models.F(field_name) * models.Value(
+        factor, output_field=models.FloatField()
+    )
+    if offset:
+        value = value + models.Value(offset, output_field=models.FloatField())
+    if field.get_internal_type() in ("IntegerField", "BigIntegerField"):
+        value = Round(value)
+    value = models.ExpressionWrapper(value, output_field=models.FloatField())
+
+    if not batch_size:
+        return queryset.update(**{field_name: value})
+
+    bounds = queryset.aggregate(low=models.Min("pk"), high=models.Max("pk"))
+    if bounds["low"] is None:
+        return 0
+    count = 0
+    for low in range(bounds["low"], bounds["high"] + 1, batch_size):
+        count += queryset.filter(pk__gte=low, pk__lt=low + batch_size).update(
+            **{field_name: value}
+        )
+    return count
+
+
+class MeasurementQuerySet(models.QuerySet):
+    """QuerySet with helpers for models with measurement fields."""
+
+    def values_in(self, *fields, unit=None):
+        """
+        Return dictionaries like `values`, with measurements as plain floats.
+
+        Measurement fields are converted to ``unit`` in the database,
+        skipping the construction of measure objects.
+        ``unit`` may be a single unit or a dictionary mapping field names to units;
+        fields without a unit are returned in their default unit.
+        """
+        clone, fields = annotate_in_units(self, fields, unit)
+        return clone.values(*fields)
+
+    def values_list_in(self, *fields, unit=None, flat=False, named=False):
+        """Return tuples like `values_list`, with measurements as plain floats."""
+        clone, fields = annotate_in_units(self, fields, unit)
+        return clone.values_list(*fields, flat=flat, named=named)
+
+    def convert_unit(self, field_name, from_unit=None, to_unit=None, **kwargs):
+        """
+        Rewrite the stored values of ``field_name`` from one storage unit to another.
+
+        See `convert_unit`; use it after changing ``storage_unit`` or
+        ``storage_scale`` of a field.
+        """
+        return convert_unit(self, field_name, from_unit, to_unit, **kwargs)
+
+
+MeasurementManager = models.Manager.from_queryset(MeasurementQuerySet)
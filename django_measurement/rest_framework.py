@@ -0,0 +1,73 @@
+"""
+Django REST framework field for measurements.
+
+Requires Django REST framework, which can be installed with
+``pip install django-measurement[rest_framework]``.
+"""
+from django.utils.translation import gettext_lazy as _
+
+from .models import MeasurementField as ModelMeasurementField
+from .serializers import encode_measurement
+from .utils import get_measurement
+
+try:
+    from rest_framework import serializers
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "django_measurement.rest_framework requires Django REST framework,"
+        " install it with 'pip install django-measurement[rest_framework]'."
+    ) from e
+
+__all__ = ("MeasurementField",)
+
+
+class MeasurementField(serializers.Field):
+    """
+    Represent measures as ``[value, unit]`` pairs.
+
+    Values are returned in ``unit``, or in the unit of each measure if no unit
+    is given. Input may be a pair in any unit of the measure or a plain number
+    in ``unit`` or the standard unit. ``measurement`` defaults to the measure
+    class of the model field on a ``ModelSerializer``.
+    """
+
+    default_error_messages = {
+        "invalid": _("Expected a [value, unit] pair."),
+        "invalid_unit": _('"{unit}" is not a valid unit.'),
+    }
+
+    def __init__(self, measurement=None, unit=None, **kwargs):
+        self.measurement = measurement
+        self.unit = unit
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        if self.measurement is None:
+            model = getattr(getattr(parent, "Meta", None), "model", None)
+            model_field = model._meta.get_field(self.source) if model else None
+            if not isinstance(model_field, ModelMeasurementField):
+                raise TypeError(
+                    "%s() requires a measurement for field '%s'."
+                    % (self.__class__.__name__, field_name)
+                )
+            self.measurement = model_field.measurement
+
+    def to_representation(self, value):
+        return encode_measurement(value, self.unit)
+
+    def to_internal_value(self, data):
+        if isinstance(data, (int, float)) and not isinstance(data, bool):
+            value, unit = data, self.unit
+        else:
+            try:
+                value, unit = data
+                value = float(value)
+            except (TypeError, ValueError):
+                self.fail("invalid")
+        if not isinstance(unit, (str, type(None))):
+            self.fail("invalid")
+        try:
+            return get_measurement(self.measurement, value, unit)
+        except (AttributeError, KeyError):
+            self.fail("invalid_unit", unit=unit)
@@ -0,0 +1,89 @@
+"""
+JSON serializer encoding measurements as compact ``[value, unit]`` pairs.
+
+Register it in your settings to use it with ``dumpdata`` and ``loaddata``::
+
+    SERIALIZATION_MODULES = {"measurement_json": "django_measurement.serializers"}
+
+Other fields are serialized like Django's ``json`` serializer. When loading,
+measurements given in the ``value:unit`` format of the default serializers are
+accepted as well.
+"""
+import json
+
+from django.apps import apps
+from django.core.serializers import json as json_serializer
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.python import Deserializer as PythonDeserializer
+
+from .models import MeasurementField
+from .utils import get_magnitude, get_measurement
+
+__all__ = ("Serializer", "Deserializer", "encode_measurement", "decode_measurement")
+
+
+def encode_measurement(value, unit=None):
+    """Return the measure ``value`` as a ``[value, unit]`` pair, or ``None``."""
+    if value is None:
+        return None
+    return list(get_magnitude(value, unit))
+
+
+def decode_measurement(measure, data):
+    """Return the ``measure`` for a pair returned by `encode_measurement`."""
+    if data is None:
+        return None
+    value, unit = data
+    return get_measurement(measure, value, unit)
+
+
+class Serializer(json_serializer.Serializer):
+    def handle_field(self, obj, field):
+        if isinstance(field, MeasurementField):
+            value = encode_measurement(field.value_from_object(obj))
+            self._current[field.name] = value
+        else:
+            super().handle_field(obj, field)
+
+
+def _get_measurement_fields(label):
+    try:
+        model = apps.get_model(label)
+    except (LookupError, TypeError, ValueError):
+        return ()
+    return tuple(
+        (field.name, field.measurement)
+        for field in model._meta.concrete_fields
+        if isinstance(field, MeasurementField)
+    )
+
+
+def _decode_objects(objects):
+    measurement_fields = {}
+    for obj in objects:
+        label = obj.get("model")
+        try:
+            fields = measurement_fields[label]
+        except KeyError:
+            fields = measurement_fields[label] = _get_measurement_fields(label)
+        data = obj.get("fields", {})
+        for name, measure in fields:
+            value = data.get(name)
+            if isinstance(value, list):
+                data[name] = decode_measurement(measure, value)
+        yield obj
+
+
+def Deserializer(stream_or_string, **options):
+    """Deserialize a stream or string of JSON data."""
+    if not isinstance(stream_or_string, (bytes, str)):
+        stream_or_string = stream_or_string.read()
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    try:
+        objects = json.loads(stream_or_string)
+        yield from PythonDeserializer(_decode_objects(objects), **options)
+    except (GeneratorExit, DeserializationError):
+        raise
+    except Exception as exc:
+        raise DeserializationError() from exc
@@ -0,0 +1,19 @@
+from django import template
+
+register = template.Library()
+
+
+@register.filter
+def in_unit(value, unit):
+    """
+    Return the magnitude of a measure in ``unit``: ``{{ value|in_unit:"mi" }}``.
+
+    Lazy values cache the result like other unit attributes. Empty values and
+    unknown units render as an empty string.
+    """
+    if value is None or value == "":
+        return ""
+    try:
+        return getattr(value, unit)
+    except (AttributeError, KeyError):
+        return ""
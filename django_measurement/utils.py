@@ -1,12 +1,354 @@
+import functools
+import math
+import time
+from decimal import Decimal
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from measurement.base import BidimensionalMeasure
 
+from . import instrumentation
 
-def get_measurement(measure, value, unit=None, original_unit=None):
-    unit = unit or measure.STANDARD_UNIT
+UNIT_CACHE_SIZE = 256
 
+
+def _build_measurement(measure, value, unit, original_unit):
     m = measure(**{unit: value})
     if original_unit:
         m.unit = original_unit
     if isinstance(m, BidimensionalMeasure):
         m.reference.value = 1
     return m
+
+
+def _get_slope(measure, unit):
+    """
+    Return ``(slope, intercept)`` converting a standard value to ``unit``.
+
+    This is the unit's own definition, ``value = standard * slope + intercept``,
+    for units defined as sympy expressions (like temperatures) that are linear
+    in the standard unit symbol. Return ``None`` for other expressions.
+    """
+    unit_value = measure.get_units()[unit]
+    if isinstance(unit_value, (int, float, Decimal)):
+        return 1 / float(unit_value), 0.0
+    try:
+        slope = float(unit_value.diff(measure.SU))
+        intercept = float(unit_value.subs(measure.SU, 0))
+    except (AttributeError, TypeError):
+        return None
+    return slope, intercept
+
+
+def _get_affine(measure, unit):
+    """
+    Return ``(factor, offset)`` converting a value in ``unit`` to the standard unit.
+
+    Units defined as sympy expressions (like temperatures) are supported as
+    long as they are linear in the standard unit symbol.
+    """
+    unit_value = measure.get_units()[unit]
+    if isinstance(unit_value, (int, float, Decimal)):
+        return float(unit_value), 0.0
+    slope = _get_slope(measure, unit)
+    if slope is None:
+        return None
+    slope, intercept = slope
+    return 1 / slope, -intercept / slope
+
+
+@functools.lru_cache(maxsize=None)
+def get_conversion_table(measure):
+    """
+    Return a dictionary mapping the units of ``measure`` to ``(factor, offset)``.
+
+    Like `UnitConversion`, ``standard = value * factor + offset``. For a
+    `BidimensionalMeasure` every ``primary__reference`` unit is included, so
+    conversions need neither unit parsing nor nested measures. Units that are
+    not linear in the standard unit are left out; aliases are not included.
+    """
+    if not issubclass(measure, BidimensionalMeasure):
+        table = {}
+        for unit in measure.get_units():
+            affine = _get_affine(measure, unit)
+            if affine is not None:
+                table[unit] = affine
+        return table
+
+    reference_cls = measure.REFERENCE_DIMENSION
+    reference_units = reference_cls.get_units()
+    reference_standard = reference_units[reference_cls.STANDARD_UNIT]
+    table = {}
+    for primary_unit, (factor, offset) in get_conversion_table(
+        measure.PRIMARY_DIMENSION
+    ).items():
+        for reference_unit, reference_value in reference_units.items():
+            scale = float(reference_value / reference_standard)
+            table["%s__%s" % (primary_unit, reference_unit)] = (
+                factor / scale,
+                offset / scale,
+            )
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def get_inverse_conversion_table(measure):
+    """
+    Return a dictionary mapping the units of ``measure`` to ``(slope, intercept)``.
+
+    The inverse of `get_conversion_table`, converting standard values with
+    ``value = standard * slope + intercept``. The slope and intercept are taken
+    from the unit's definition rather than inverted from the factor, which
+    would lose precision. See `from_standard`.
+    """
+    if not issubclass(measure, BidimensionalMeasure):
+        table = {}
+        for unit in measure.get_units():
+            slope = _get_slope(measure, unit)
+            if slope is not None:
+                table[unit] = slope
+        return table
+
+    reference_cls = measure.REFERENCE_DIMENSION
+    reference_units = reference_cls.get_units()
+    reference_standard = reference_units[reference_cls.STANDARD_UNIT]
+    table = {}
+    for primary_unit, (slope, intercept) in get_inverse_conversion_table(
+        measure.PRIMARY_DIMENSION
+    ).items():
+        for reference_unit, reference_value in reference_units.items():
+            scale = float(reference_value / reference_standard)
+            table["%s__%s" % (primary_unit, reference_unit)] = (
+                slope * scale,
+                intercept,
+            )
+    return table
+
+
+def from_standard(measure, unit, standard):
+    """
+    Return the float ``standard`` converted to the canonical ``unit`` of ``measure``.
+
+    Units without offset divide by their factor like python-measurement does.
+    Other units use `get_inverse_conversion_table`; as adding the intercept
+    cancels digits, the result is rounded to 15 significant digits of the
+    larger term, like python-measurement's 15 digit evaluation.
+    Raise ``KeyError`` for units missing from `get_conversion_table`.
+    """
+    factor, offset = get_conversion_table(measure)[unit]
+    if not offset:
+        return standard / factor
+    slope, intercept = get_inverse_conversion_table(measure)[unit]
+    scaled = standard * slope
+    magnitude = max(abs(scaled), abs(intercept))
+    if not math.isfinite(magnitude):
+        return scaled + intercept
+    return round(scaled + intercept, 14 - math.floor(math.log10(magnitude)))
+
+
+def _has_plain_state(m, *attrs):
+    return set(m.__dict__) == set(attrs)
+
+
+class UnitConversion:
+    """
+    Precomputed conversion of a measure unit, as used by `get_measurement`.
+
+    ``factor`` and ``offset`` convert a value given in ``unit`` to the standard
+    unit of the measure (``standard = value * factor + offset``).
+    ``display_unit`` is the canonical unit the constructed measure is shown in.
+    """
+
+    __slots__ = (
+        "measure",
+        "unit",
+        "display_unit",
+        "factor",
+        "offset",
+        "bidimensional",
+        "_primary",
+        "_display_units",
+        "_reference_change",
+        "_reference_standard",
+    )
+
+    def __init__(self, measure, unit, original_unit=None):
+        probe = measure(**{unit: 1.0})
+        self.measure = measure
+        self.bidimensional = isinstance(probe, BidimensionalMeasure)
+        self._primary = None
+
+        if self.bidimensional:
+            self._init_bidimensional(probe, original_unit)
+        else:
+            self.unit = probe.unit
+            if original_unit:
+                probe.unit = original_unit
+            self.display_unit = probe.unit
+            affine = _get_affine(measure, self.unit)
+            if affine is not None and _has_plain_state(
+                probe, measure.STANDARD_UNIT, "_default_unit"
+            ):
+                self._primary = affine
+            self.factor, self.offset = affine or (None, None)
+
+    def _init_bidimensional(self, probe, original_unit):
+        measure = self.measure
+        primary_cls = measure.PRIMARY_DIMENSION
+        reference_cls = measure.REFERENCE_DIMENSION
+        primary_unit, reference_unit = probe.primary.unit, probe.reference.unit
+        self.unit = probe.unit
+        if original_unit:
+            probe.unit = original_unit
+        self.display_unit = probe.unit
+        self._display_units = probe.primary.unit, probe.reference.unit
+
+        reference_units = reference_cls.get_units()
+        self._reference_change = None
+        if probe.reference.unit != reference_unit:
+            self._reference_change = (
+                reference_units[reference_unit] / reference_units[probe.reference.unit]
+            )
+        self._reference_standard = 1 * (
+            reference_units[probe.reference.unit]
+            / reference_units[reference_cls.STANDARD_UNIT]
+        )
+
+        affine = _get_affine(primary_cls, primary_unit)
+        self.factor, self.offset = get_conversion_table(measure).get(
+            self.unit, (None, None)
+        )
+        if affine is None:
+            return
+
+        if (
+            _has_plain_state(probe, "primary", "reference")
+            and type(probe.primary) is primary_cls
+            and type(probe.reference) is reference_cls
+            and _has_plain_state(
+                probe.primary, primary_cls.STANDARD_UNIT, "_default_unit"
+            )
+            and _has_plain_state(
+                probe.reference, reference_cls.STANDARD_UNIT, "_default_unit"
+            )
+        ):
+            self._primary = affine
+
+    @property
+    def direct(self):
+        """Whether `build` can create measures without calling their ``__init__``."""
+        return self._primary is not None
+
+    def build(self, value):
+        """Return a measure holding ``value``, given in ``unit``."""
+        if not isinstance(value, float):
+            value = float(value)
+        factor, offset = self._primary
+        if not self.bidimensional:
+            m = self.measure.__new__(self.measure)
+            m.__dict__.update(
+                {
+                    self.measure.STANDARD_UNIT: value * factor + offset,
+                    "_default_unit": self.display_unit,
+                }
+            )
+            return m
+
+        primary_cls = self.measure.PRIMARY_DIMENSION
+        reference_cls = self.measure.REFERENCE_DIMENSION
+        primary_unit, reference_unit = self._display_units
+        primary_standard = value * factor + offset
+        if self._reference_change:
+            primary_standard = primary_standard / self._reference_change
+
+        primary = primary_cls.__new__(primary_cls)
+        primary.__dict__.update(
+            {primary_cls.STANDARD_UNIT: primary_standard, "_default_unit": primary_unit}
+        )
+        reference = reference_cls.__new__(reference_cls)
+        reference.__dict__.update(
+            {
+                reference_cls.STANDARD_UNIT: self._reference_standard,
+                "_default_unit": reference_unit,
+            }
+        )
+        m = self.measure.__new__(self.measure)
+        m.__dict__.update({"primary": primary, "reference": reference})
+        return m
+
+
+@functools.lru_cache(maxsize=UNIT_CACHE_SIZE)
+def get_unit_conversion(measure, unit=None, original_unit=None):
+    """
+    Return the cached `UnitConversion` for a measure class and unit.
+
+    The cache is a bounded LRU cache, see ``get_unit_conversion.cache_info()``
+    and ``get_unit_conversion.cache_clear()``.
+    """
+    return UnitConversion(measure, unit or measure.STANDARD_UNIT, original_unit)
+
+
+_backend = None
+
+
+def get_backend():
+    """
+    Return the measure backend selected with the ``MEASUREMENT_BACKEND`` setting.
+
+    Without configured Django settings, for example in worker processes,
+    python-measurement objects are built.
+    """
+    global _backend
+    if _backend is None:
+        from django.conf import settings as django_settings
+        from django.utils.module_loading import import_string
+
+        from .backends import MeasurementBackend
+
+        if not django_settings.configured:
+            return MeasurementBackend()
+
+        from .conf import settings
+
+        _backend = import_string(settings.MEASUREMENT_BACKEND)()
+    return _backend
+
+
+@receiver(setting_changed)
+def reset_backend(setting, **kwargs):
+    global _backend
+    if setting == "MEASUREMENT_BACKEND":
+        _backend = None
+
+
+def get_measurement(measure, value, unit=None, original_unit=None):
+    started = time.perf_counter() if instrumentation.enabled else None
+    m = get_backend().build(
+        measure, value, unit or measure.STANDARD_UNIT, original_unit
+    )
+    if started is not None:
+        instrumentation.record("get_measurement", measure, m.unit, started)
+    return m
+
+
+def get_magnitude(value, unit=None):
+    """
+    Return ``(magnitude, unit)`` of the measure ``value`` in ``unit``.
+
+    ``unit`` defaults to the unit of ``value``. The conversion table of the
+    measure is used instead of the measure's own attribute lookup.
+    """
+    unit = unit or value.unit
+    measure = value.__class__
+    standard = float(value.standard)
+    try:
+        return from_standard(measure, unit, standard), unit
+    except KeyError:
+        conversion = get_unit_conversion(measure, unit)
+        if conversion.factor is None:
+            return getattr(value, conversion.unit), conversion.unit
+        return from_standard(measure, conversion.unit, standard), conversion.unit
+
+
+get_measurement.cache_info = get_unit_conversion.cache_info
+get_measurement.cache_clear = get_unit_conversion.cache_clear
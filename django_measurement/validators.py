@@ -0,0 +1,60 @@
+"""Validators comparing measures by their value in the standard unit."""
+from django.core import validators
+from django.core.exceptions import ValidationError
+from django.utils.deconstruct import deconstructible
+
+__all__ = ("MinMeasurementValidator", "MaxMeasurementValidator", "get_bounds")
+
+
+class MeasurementBoundMixin:
+    """
+    Keep the limit of a value validator in the standard unit of its measure.
+
+    Values are compared as floats in the standard unit, without converting
+    the limit again for every value.
+    """
+
+    def __init__(self, limit_value, message=None):
+        super().__init__(limit_value, message)
+        self.measure = limit_value.__class__
+        self.standard = float(limit_value.standard)
+
+    def __call__(self, value):
+        if not isinstance(value, self.measure):
+            raise TypeError(
+                "%s cannot be compared with %s." % (value, self.measure.__name__)
+            )
+        if self.compare(float(value.standard), self.standard):
+            params = {
+                "limit_value": self.limit_value,
+                "show_value": value,
+                "value": value,
+            }
+            raise ValidationError(self.message, code=self.code, params=params)
+
+
+@deconstructible
+class MinMeasurementValidator(MeasurementBoundMixin, validators.MinValueValidator):
+    pass
+
+
+@deconstructible
+class MaxMeasurementValidator(MeasurementBoundMixin, validators.MaxValueValidator):
+    pass
+
+
+def get_bounds(field_validators, measure):
+    """
+    Yield the bound validators of ``measure`` with their limit in the standard unit.
+
+    Yields ``(validator, standard)`` pairs for measurement validators as well as
+    Django's ``MinValueValidator`` and ``MaxValueValidator`` holding a measure.
+    """
+    for validator in field_validators:
+        if isinstance(validator, MeasurementBoundMixin):
+            if issubclass(validator.measure, measure):
+                yield validator, validator.standard
+        elif isinstance(
+            validator, (validators.MinValueValidator, validators.MaxValueValidator)
+        ) and isinstance(validator.limit_value, measure):
+            yield validator, float(validator.limit_value.standard)
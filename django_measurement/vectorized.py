@@ -0,0 +1,104 @@
+"""
+Bulk conversion of measurement magnitudes stored in NumPy arrays.
+
+Requires NumPy, which can be installed with ``pip install django-measurement[numpy]``.
+"""
+from django.core.exceptions import ValidationError
+
+from .utils import get_measurement, get_unit_conversion
+from .validators import get_bounds
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "django_measurement.vectorized requires NumPy,"
+        " install it with 'pip install django-measurement[numpy]'."
+    ) from e
+
+__all__ = ("get_scale", "convert", "to_standard", "from_standard", "validate_many")
+
+
+def _unit_name(unit):
+    if isinstance(unit, (tuple, list)):
+        return "__".join(unit)
+    return unit
+
+
+def _get_affine(measure, unit):
+    conversion = get_unit_conversion(measure, _unit_name(unit))
+    if conversion.factor is None:
+        raise ValueError(
+            "Unit %s of %s cannot be converted with a linear function."
+            % (conversion.unit, measure.__name__)
+        )
+    return conversion.factor, conversion.offset
+
+
+def get_scale(measure, unit=None, to_unit=None):
+    """
+    Return ``(scale, shift)`` converting magnitudes from ``unit`` to ``to_unit``.
+
+    Values are converted with ``value * scale + shift``. Both units default to
+    the standard unit of the measure. Units of a `BidimensionalMeasure` may be
+    given as ``"primary__reference"`` strings or as ``(primary, reference)``
+    pairs.
+    """
+    factor, offset = _get_affine(measure, unit)
+    to_factor, to_offset = _get_affine(measure, to_unit)
+    return factor / to_factor, (offset - to_offset) / to_factor
+
+
+def convert(measure, values, unit=None, to_unit=None, out=None):
+    """
+    Convert an array of magnitudes in ``unit`` to ``to_unit``.
+
+    The conversion factor is resolved once through the same cache used by
+    `django_measurement.utils.get_measurement`, the array is converted with a
+    single multiply-add. Pass ``out`` to write the result into an existing
+    float array, which may be ``values`` itself.
+    """
+    scale, shift = get_scale(measure, unit, to_unit)
+    values = np.asarray(values, dtype=np.float64)
+    out = np.multiply(values, scale, out=out)
+    if shift:
+        out += shift
+    return out
+
+
+def to_standard(measure, values, unit=None, out=None):
+    """Convert an array of magnitudes in ``unit`` to the standard unit of ``measure``."""
+    return convert(measure, values, unit=unit, out=out)
+
+
+def from_standard(measure, values, to_unit=None, out=None):
+    """Convert an array of magnitudes in the standard unit of ``measure`` to ``to_unit``."""
+    return convert(measure, values, to_unit=to_unit, out=out)
+
+
+def validate_many(field, values, unit=None):
+    """
+    Check an array of magnitudes in ``unit`` against the bounds of ``field``.
+
+    ``field`` is a model or form ``MeasurementField``; its minimum and maximum
+    measurement validators are applied to all values at once, other validators
+    are not run. Raises a ``ValidationError`` listing every failing value, with
+    its position in ``values`` as the ``index`` parameter.
+    """
+    measure = getattr(field, "measurement", None) or field.measurement_class
+    standard = to_standard(measure, values, unit=unit)
+    errors = []
+    for validator, limit in get_bounds(field.validators, measure):
+        for index in np.flatnonzero(validator.compare(standard, limit)):
+            value = get_measurement(measure, float(standard[index]))
+            params = {
+                "limit_value": validator.limit_value,
+                "show_value": value,
+                "value": value,
+                "index": int(index),
+            }
+            errors.append(
+                ValidationError(validator.message, code=validator.code, params=params)
+            )
+    if errors:
+        raise ValidationError(errors)
@@ -0,0 +1,39 @@
+import pytest
+from measurement import measures
+
+from tests.models import MeasurementTestModel
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "instances(values, **fields): rows created by the instances fixture",
+    )
+
+
+@pytest.fixture
+def instances(request, db):
+    """
+    Create one test model per value, with ``measurement_distance`` in km.
+
+    The ``instances`` marker overrides the values and adds fields, either as
+    a callable taking the value or as a measure shared by every row::
+
+        pytestmark = pytest.mark.instances(
+            (1, 4, 10), measurement_speed=lambda v: measures.Speed(mph=v)
+        )
+    """
+    marker = request.node.get_closest_marker("instances")
+    values, fields = (1, 2, 3), {}
+    if marker is not None:
+        values = marker.args[0] if marker.args else values
+        fields = marker.kwargs
+    return [
+        MeasurementTestModel.objects.create(
+            measurement_distance=measures.Distance(km=value),
+            **{
+                name: field(value) if callable(field) else field
+                for name, field in fields.items()
+            }
+        )
+        for value in values
+    ]
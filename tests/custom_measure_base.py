@@ -20,6 +20,7 @@ class Temperature(MeasureBase):
 
 
 class Time(MeasureBase):
+    STANDARD_UNIT = "h"
     UNITS = {
         "s": 3600.0,
         "h": 1.0,
@@ -3,6 +3,7 @@ from django.db import models
 from measurement import measures
 
 from django_measurement.models import MeasurementField
+from django_measurement.query import MeasurementManager
 from tests.custom_measure_base import DegreePerTime, Temperature, Time
 
 
@@ -88,5 +89,63 @@ class MeasurementTestModel(models.Model):
 
     measurement_custom_time = MeasurementField(measurement=Time, blank=True, null=True,)
 
+    measurement_distance_lazy = MeasurementField(
+        measurement=measures.Distance, lazy=True, blank=True, null=True,
+    )
+
+    measurement_speed_compact = MeasurementField(
+        measurement=measures.Speed,
+        unit_choices=(("mi__hr", "mph"),),
+        compact=True,
+        blank=True,
+        null=True,
+    )
+
+    measurement_weight_trusted = MeasurementField(
+        measurement=measures.Weight,
+        unit_choices=(("kg", "kg"),),
+        trusted_floats=True,
+        blank=True,
+        null=True,
+    )
+
+    measurement_distance_decimal = MeasurementField(
+        measurement=measures.Distance,
+        unit_choices=(("km", "km"),),
+        storage_unit="km",
+        storage_type="decimal",
+        max_digits=12,
+        decimal_places=3,
+        blank=True,
+        null=True,
+    )
+
+    measurement_weight_micro = MeasurementField(
+        measurement=measures.Weight,
+        storage_type="biginteger",
+        storage_scale=6,
+        blank=True,
+        null=True,
+    )
+
+    measurement_temperature_int = MeasurementField(
+        measurement=measures.Temperature,
+        storage_unit="c",
+        storage_type="integer",
+        storage_scale=2,
+        blank=True,
+        null=True,
+    )
+
+    measurement_speed_original = MeasurementField(
+        measurement=measures.Speed,
+        unit_choices=(("mi__hr", "mph"), ("km__hr", "km/h"), ("m__s", "m/s")),
+        store_unit=True,
+        blank=True,
+        null=True,
+    )
+
+    objects = MeasurementManager()
+
     def __str__(self):
         return self.measurement
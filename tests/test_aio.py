@@ -0,0 +1,73 @@
+import pytest
+from measurement import measures
+
+from tests.models import MeasurementTestModel
+
+async_to_sync = pytest.importorskip("asgiref.sync").async_to_sync
+aio = pytest.importorskip("django_measurement.aio")
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.instances(measurement_weight=lambda km: measures.Weight(kg=km)),
+]
+
+
+def collect(*args, **kwargs):
+    async def inner():
+        return [row async for row in aio.aiter_measurements(*args, **kwargs)]
+
+    return async_to_sync(inner)()
+
+
+def test_aiter_measurements(instances):
+    rows = collect(
+        MeasurementTestModel.objects.order_by("pk"),
+        "pk",
+        "measurement_distance",
+        "measurement_weight",
+        unit={"measurement_distance": "km"},
+        chunk_size=2,
+    )
+
+    assert rows == [(m.pk, km, km * 1000.0) for m, km in zip(instances, (1, 2, 3))]
+
+
+def test_aiter_measurements_flat(instances):
+    rows = collect(
+        MeasurementTestModel.objects.order_by("pk"),
+        "measurement_distance",
+        unit="mi",
+        flat=True,
+    )
+
+    assert rows == [pytest.approx(measures.Distance(km=km).mi) for km in (1, 2, 3)]
+
+
+class TestSaveRows:
+    def test_iterable(self):
+        rows = [{"measurement_distance": "%s:km" % i} for i in range(5)]
+
+        count = async_to_sync(aio.asave_rows)(MeasurementTestModel, rows, batch_size=2)
+
+        assert count == 5
+        assert sorted(
+            m.measurement_distance.km for m in MeasurementTestModel.objects.all()
+        ) == [0, 1, 2, 3, 4]
+
+    def test_async_iterable(self, instances):
+        async def rows():
+            for instance in instances:
+                yield {"id": instance.pk, "measurement_weight": "1:lb"}
+
+        count = async_to_sync(aio.asave_rows)(
+            MeasurementTestModel,
+            rows(),
+            batch_size=2,
+            update_fields=["measurement_weight"],
+        )
+
+        assert count == 3
+        for instance in instances:
+            instance.refresh_from_db()
+            assert instance.measurement_weight == measures.Weight(lb=1)
+            assert instance.measurement_distance is not None
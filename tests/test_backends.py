@@ -0,0 +1,105 @@
+import pickle
+
+import pytest
+from measurement import measures
+
+from django_measurement import fast
+from django_measurement.utils import get_backend, get_measurement
+from tests.custom_measure_base import DegreePerTime
+from tests.forms import MeasurementTestForm
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def float_backend(settings):
+    settings.MEASUREMENT_BACKEND = "django_measurement.backends.FloatBackend"
+
+
+@pytest.mark.parametrize(
+    "measure, kwargs, to_unit",
+    [
+        (measures.Distance, {"mi": 2.0}, "km"),
+        (measures.Distance, {"kilometer": 2.0}, "ft"),
+        (measures.Weight, {"lb": 3.0}, "kg"),
+        (measures.Temperature, {"f": 98.6}, "c"),
+        (measures.Volume, {"us_pint": 1.0}, "l"),
+        (measures.Speed, {"mph": 10.0}, "km__hr"),
+        (measures.Speed, {"mile__hour": 10.0}, "m__s"),
+    ],
+)
+def test_fast_measures(measure, kwargs, to_unit):
+    expected = measure(**kwargs)
+    value = fast.MEASURES[measure](**kwargs)
+
+    assert isinstance(value, measure)
+    assert value.unit == expected.unit
+    assert value.value == pytest.approx(float(expected.value))
+    assert value.standard == pytest.approx(float(expected.standard))
+    assert getattr(value, to_unit) == pytest.approx(getattr(expected, to_unit))
+    assert value == expected
+    assert expected == value
+    assert value < expected * 2
+    assert value + expected == expected * 2
+    assert type(value * 2) is type(value)
+    assert pickle.loads(pickle.dumps(value)) == value
+
+
+def test_fast_unit():
+    value = fast.Speed(kph=36)
+
+    assert str(value) == "36.0 km/hr"
+    assert repr(value) == "Speed(km__hr=36.0)"
+    assert value.primary == measures.Distance(km=36)
+    assert value.reference == measures.Time(hr=1)
+
+    value.unit = "m__s"
+    assert value.value == pytest.approx(10)
+    with pytest.raises(ValueError):
+        value.unit = "parsec__s"
+    with pytest.raises(AttributeError):
+        value.parsec__s
+
+    temperature = fast.Temperature(c=0)
+    temperature.value = 100
+    assert temperature.k == pytest.approx(373.15)
+
+    assert fast.Temperature(c=20).f == 68.0
+    assert fast.Temperature(f=68).value == 68.0
+
+
+class TestFloatBackend:
+    def test_default(self):
+        assert type(get_backend()).__name__ == "MeasurementBackend"
+        assert type(get_measurement(measures.Distance, 1.0, "km")) is measures.Distance
+
+    def test_get_measurement(self, float_backend):
+        value = get_measurement(measures.Speed, 10.0, "mph", "km__hr")
+
+        assert type(value) is fast.Speed
+        assert value.unit == "km__hr"
+        assert value.mph == pytest.approx(10)
+        assert type(get_measurement(DegreePerTime, 1.0, "c__s")) is DegreePerTime
+
+    def test_fields(self, float_backend):
+        MeasurementTestModel.objects.create(
+            measurement_distance=measures.Distance(km=2),
+            measurement_speed_mph=fast.Speed(mph=2),
+        )
+
+        instance = MeasurementTestModel.objects.get()
+
+        assert type(instance.measurement_distance) is fast.Distance
+        assert instance.measurement_speed_mph == measures.Speed(mph=2)
+        assert MeasurementTestModel.objects.filter(
+            measurement_distance__gt=fast.Distance(km=1)
+        ).exists()
+
+        form = MeasurementTestForm(
+            {"measurement_distance_0": 2.0, "measurement_distance_1": "mi"}
+        )
+        assert form.is_valid()
+        assert type(form.cleaned_data["measurement_distance"]) is fast.Distance
@@ -0,0 +1,157 @@
+import io
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from measurement import measures
+
+from django_measurement import bulk
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.instances(measurement_speed_mph=lambda i: measures.Speed(mph=i)),
+]
+
+FIELDS = ["id", "measurement_distance", "measurement_speed_mph", "measurement_weight"]
+
+
+class TestExport:
+    def test_csv(self, instances):
+        stream = io.StringIO()
+
+        count = bulk.export_measurements(
+            MeasurementTestModel.objects.order_by("pk"), stream, fields=FIELDS
+        )
+
+        assert count == 3
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == ",".join(FIELDS)
+        assert lines[1] == "%s,1000.0:m,0.44704:m__s," % instances[0].pk
+
+    def test_ndjson(self, instances):
+        stream = io.StringIO()
+
+        bulk.export_measurements(
+            MeasurementTestModel.objects.order_by("pk"),
+            stream,
+            fields=FIELDS,
+            unit={"measurement_distance": "km"},
+            format="ndjson",
+        )
+
+        rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert rows[2] == {
+            "id": instances[2].pk,
+            "measurement_distance": "3.0:km",
+            "measurement_speed_mph": "%s:m__s" % (3 * 0.44704),
+            "measurement_weight": None,
+        }
+
+    def test_unknown_format(self, instances):
+        with pytest.raises(ValueError):
+            bulk.export_measurements(
+                MeasurementTestModel.objects.all(), io.StringIO(), format="xml"
+            )
+
+
+class TestImport:
+    def test_csv(self):
+        stream = io.StringIO(
+            "measurement_distance,measurement_speed_mph,measurement_weight\n"
+            "2:km,10:kph,\n"
+            "5,,3:lb\n"
+        )
+
+        assert bulk.import_measurements(MeasurementTestModel, stream) == 2
+
+        first, second = MeasurementTestModel.objects.order_by("pk")
+        assert first.measurement_distance == measures.Distance(km=2)
+        assert first.measurement_speed_mph == measures.Speed(kph=10)
+        assert first.measurement_weight is None
+        assert second.measurement_distance == measures.Distance(m=5)
+        assert second.measurement_weight == measures.Weight(lb=3)
+
+    def test_ndjson_update(self, instances):
+        stream = io.StringIO(
+            "\n".join(
+                json.dumps({"id": obj.pk, "measurement_distance": "%d:mi" % obj.pk})
+                for obj in instances
+            )
+        )
+
+        count = bulk.import_measurements(
+            MeasurementTestModel, stream, format="ndjson", batch_size=2, update=True
+        )
+
+        assert count == 3
+        for obj in MeasurementTestModel.objects.all():
+            assert obj.measurement_distance == measures.Distance(mi=obj.pk)
+            assert obj.measurement_speed_mph is not None
+
+    def test_empty(self):
+        assert bulk.import_measurements(MeasurementTestModel, io.StringIO("")) == 0
+
+
+class TestCommands:
+    def test_round_trip(self, instances, tmp_path):
+        path = str(tmp_path / "measurements.ndjson")
+        expected = list(
+            MeasurementTestModel.objects.order_by("pk").values_list(
+                "measurement_distance", "measurement_speed_mph"
+            )
+        )
+
+        call_command(
+            "dumpmeasurements",
+            "tests.MeasurementTestModel",
+            fields=",".join(FIELDS[1:]),
+            output=path,
+            format="ndjson",
+            verbosity=0,
+        )
+        MeasurementTestModel.objects.all().delete()
+        call_command(
+            "loadmeasurements", "tests.MeasurementTestModel", path, verbosity=0
+        )
+
+        assert (
+            list(
+                MeasurementTestModel.objects.order_by("pk").values_list(
+                    "measurement_distance", "measurement_speed_mph"
+                )
+            )
+            == expected
+        )
+
+    def test_stdout(self, instances):
+        stdout = io.StringIO()
+
+        call_command(
+            "dumpmeasurements",
+            "tests.MeasurementTestModel",
+            fields="id,measurement_distance",
+            format="ndjson",
+            stdout=stdout,
+        )
+
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert len(rows) == len(instances)
+        assert rows[0]["measurement_distance"].endswith(":m")
+
+    def test_load_extensions(self, tmp_path):
+        path = tmp_path / "measurements.jsonl"
+        path.write_text('{"measurement_distance": "2.0:km"}\n')
+
+        call_command(
+            "loadmeasurements", "tests.MeasurementTestModel", str(path), verbosity=0
+        )
+
+        assert MeasurementTestModel.objects.get().measurement_distance.km == 2.0
+
+        path = tmp_path / "measurements.txt"
+        path.write_text("")
+        with pytest.raises(CommandError):
+            call_command(
+                "loadmeasurements", "tests.MeasurementTestModel", str(path), verbosity=0
+            )
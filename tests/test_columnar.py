@@ -0,0 +1,131 @@
+import pytest
+from django.core.management import CommandError, call_command
+from measurement import measures
+
+from tests.models import MeasurementTestModel
+
+np = pytest.importorskip("numpy")
+columnar = pytest.importorskip("django_measurement.columnar")
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture
+def instances():
+    MeasurementTestModel.objects.bulk_create(
+        MeasurementTestModel(measurement_distance=measures.Distance(km=km))
+        for km in (1, 2, 3, 4, 5)
+    )
+    MeasurementTestModel.objects.create(measurement_distance_km=None)
+
+
+def test_iter_chunks(instances):
+    queryset = MeasurementTestModel.objects.order_by("pk")
+
+    chunks = list(columnar.iter_chunks(queryset, "measurement_distance", "km", 4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    assert chunks[0].dtype == np.float64
+    np.testing.assert_allclose(chunks[0], [1, 2, 3, 4])
+    assert np.isnan(chunks[1][1])
+
+    with pytest.raises(ValueError):
+        next(columnar.iter_chunks(queryset, "id"))
+
+
+def test_iter_chunks_standard_unit(db):
+    MeasurementTestModel.objects.create(
+        measurement_weight_trusted=measures.Weight(kg=2)
+    )
+    queryset = MeasurementTestModel.objects.all()
+
+    chunks = list(columnar.iter_chunks(queryset, "measurement_weight_trusted"))
+
+    np.testing.assert_allclose(np.concatenate(chunks), [2000.0])
+
+
+def test_export_npy(instances, tmp_path):
+    path = str(tmp_path / "distance.npy")
+
+    count = columnar.export_column(
+        MeasurementTestModel.objects.exclude(measurement_distance=None).order_by("pk"),
+        "measurement_distance",
+        path,
+        unit="mi",
+        chunk_size=2,
+    )
+
+    values = np.load(path, mmap_mode="r")
+    assert count == 5
+    assert isinstance(values, np.memmap)
+    np.testing.assert_allclose(
+        values, [measures.Distance(km=km).mi for km in (1, 2, 3, 4, 5)]
+    )
+
+
+def test_export_arrow(instances, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    path = str(tmp_path / "distance.arrow")
+
+    count = columnar.export_column(
+        MeasurementTestModel.objects.order_by("pk"), "measurement_distance", path
+    )
+
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    column = table.column("measurement_distance")
+    assert count == 6
+    assert column.type == pa.float64()
+    assert column.null_count == 1
+    assert column.to_pylist()[:5] == [1000.0, 2000.0, 3000.0, 4000.0, 5000.0]
+
+
+def test_export_parquet(instances, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "distance.parquet")
+
+    count = columnar.export_column(
+        MeasurementTestModel.objects.order_by("pk"),
+        "measurement_distance",
+        path,
+        unit="km",
+        chunk_size=4,
+    )
+
+    column = pq.read_table(path).column("measurement_distance")
+    assert count == 6
+    assert column.num_chunks == 2
+    assert column.to_pylist() == [1.0, 2.0, 3.0, 4.0, 5.0, None]
+
+
+def test_get_format():
+    assert columnar.get_format("readings.parquet") == "parquet"
+    assert columnar.get_format("readings.bin") == "npy"
+    with pytest.raises(ValueError):
+        columnar.get_format("readings.npy", "csv")
+
+
+def test_command(instances, tmp_path):
+    path = str(tmp_path / "distance.npy")
+
+    call_command(
+        "dumpmeasurementcolumn",
+        "tests.MeasurementTestModel",
+        "measurement_distance",
+        path,
+        unit="km",
+        verbosity=0,
+    )
+
+    np.testing.assert_allclose(np.load(path)[:5], [1, 2, 3, 4, 5])
+
+    with pytest.raises(CommandError):
+        call_command(
+            "dumpmeasurementcolumn",
+            "tests.MeasurementTestModel",
+            "measurement_distance",
+            path,
+            unit="parsec",
+            verbosity=0,
+        )
@@ -0,0 +1,85 @@
+import pickle
+
+import pytest
+from measurement import measures
+
+from django_measurement.compact import CompactMeasurement
+from tests.models import MeasurementTestModel
+
+
+class TestCompactMeasurement:
+    @pytest.mark.django_db
+    def test_field_option(self):
+        MeasurementTestModel.objects.create(
+            measurement_speed_compact=measures.Speed(kph=100)
+        )
+
+        value = MeasurementTestModel.objects.get().measurement_speed_compact
+
+        assert type(value) is CompactMeasurement
+        assert isinstance(value, measures.Speed)
+        assert value == measures.Speed(kph=100)
+        assert value.unit == "mi__hr"
+        assert value.value == pytest.approx(measures.Speed(kph=100).mi__hr)
+        assert str(value) == "%s mi/hr" % value.value
+
+    def test_unit_attributes(self):
+        value = CompactMeasurement.from_measure(measures.Distance(km=2))
+
+        assert value.unit == "km"
+        assert value.value == 2
+        assert value.m == 2000
+        assert value.mi == pytest.approx(measures.Distance(km=2).mi)
+        assert repr(value) == "Distance(km=2.0)"
+        assert not hasattr(value, "parsec")
+
+    def test_temperature(self):
+        value = CompactMeasurement(measures.Temperature, 300.0, "c")
+
+        assert value.value == pytest.approx(26.85)
+        assert value.f == pytest.approx(measures.Temperature(k=300).f)
+
+        value.value = 20
+        assert value == measures.Temperature(c=20)
+        assert value.f == 68.0
+
+    def test_comparison(self):
+        small = CompactMeasurement(measures.Weight, 1.0)
+        large = CompactMeasurement(measures.Weight, 1000.0, "kg")
+
+        assert small < large
+        assert large > measures.Weight(g=10)
+        assert measures.Weight(g=10) < large
+        assert small == measures.Weight(g=1)
+        assert small != large
+        assert float(large) == 1000.0
+
+    def test_arithmetic(self):
+        value = CompactMeasurement(measures.Distance, 1000.0, "km")
+
+        total = value + measures.Distance(km=1)
+        assert type(total) is CompactMeasurement
+        assert total == measures.Distance(km=2)
+        assert total.unit == "km"
+        assert measures.Distance(km=1) + value == measures.Distance(km=2)
+        assert 3 * value == measures.Distance(km=3)
+        assert value / 2 == measures.Distance(m=500)
+        assert value / measures.Distance(m=500) == 2
+        assert value - value == measures.Distance(m=0)
+        assert isinstance(value * measures.Distance(m=2), measures.Area)
+
+    def test_to_measure(self):
+        value = CompactMeasurement(measures.Speed, 10.0, "km__hr")
+        measure = value.to_measure()
+
+        assert type(measure) is measures.Speed
+        assert measure.unit == "km__hr"
+        assert measure == value
+
+    def test_pickle(self):
+        value = CompactMeasurement(measures.Weight, 1000.0, "kg")
+        unpickled = pickle.loads(pickle.dumps(value))
+
+        assert type(unpickled) is CompactMeasurement
+        assert unpickled == value
+        assert unpickled.unit == "kg"
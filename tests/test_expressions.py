@@ -0,0 +1,84 @@
+import pytest
+from django.db.models import F
+from measurement import measures
+
+from django_measurement import expressions
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.instances(
+        (1, 4, 10),
+        measurement_speed=lambda km: measures.Speed(mph=km),
+        measurement_temperature=lambda km: measures.Temperature(c=km),
+    ),
+]
+
+
+class TestInUnit:
+    def test_annotate(self, instances):
+        values = MeasurementTestModel.objects.annotate(
+            miles=expressions.InUnit("measurement_distance", "mi"),
+            celsius=expressions.InUnit("measurement_temperature", "c"),
+        ).order_by("pk")
+
+        assert [v.miles for v in values] == [
+            pytest.approx(measures.Distance(km=km).mi) for km in (1, 4, 10)
+        ]
+        assert [v.celsius for v in values] == [pytest.approx(c) for c in (1, 4, 10)]
+
+    def test_filter(self, instances):
+        queryset = MeasurementTestModel.objects.annotate(
+            mph=expressions.InUnit("measurement_speed", "mi__hr")
+        ).filter(mph__gt=3.5)
+
+        assert queryset.count() == 2
+
+    def test_requires_measurement_field(self, instances):
+        with pytest.raises(TypeError):
+            MeasurementTestModel.objects.annotate(pk_in_m=expressions.InUnit(F("pk")))
+
+
+class TestAggregates:
+    def test_aggregate(self, instances):
+        result = MeasurementTestModel.objects.aggregate(
+            total=expressions.Sum("measurement_distance", unit="km"),
+            average=expressions.Avg("measurement_speed", unit="mi__hr"),
+            minimum=expressions.Min("measurement_distance"),
+            maximum=expressions.Max("measurement_distance", unit="mi"),
+        )
+
+        assert result["total"] == measures.Distance(km=15)
+        assert result["total"].unit == "km"
+        assert result["average"].unit == "mi__hr"
+        assert result["average"].value == pytest.approx(5)
+        assert result["minimum"] == measures.Distance(km=1)
+        assert result["minimum"].unit == "m"
+        assert result["maximum"].unit == "mi"
+
+    def test_empty(self):
+        result = MeasurementTestModel.objects.aggregate(
+            total=expressions.Sum("measurement_distance", unit="km")
+        )
+
+        assert result["total"] is None
+
+
+class TestLookups:
+    def test_measure_constants(self, instances):
+        queryset = MeasurementTestModel.objects
+
+        assert (
+            queryset.filter(measurement_distance__gt=measures.Distance(mi=2)).count()
+            == 2
+        )
+        assert (
+            queryset.filter(
+                measurement_distance__range=(
+                    measures.Distance(mi=0.5),
+                    measures.Distance(km=5),
+                )
+            ).count()
+            == 2
+        )
+        assert queryset.filter(measurement_speed__lt=measures.Speed(kph=5)).count() == 1
@@ -1,11 +1,27 @@
+from decimal import Decimal
+from unittest import mock
+
 import pytest
 from django.core import serializers
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from django.test import override_settings
 from django.utils import module_loading
 from measurement import measures
 from measurement.measures import Distance
 
-from django_measurement.forms import MeasurementField
+from django_measurement import bulk, expressions
+from django_measurement.forms import (
+    MeasurementField,
+    MeasurementWidget,
+    get_unit_choices,
+)
+from django_measurement.models import (
+    MeasurementField as ModelMeasurementField,
+    trusted_floats,
+)
+from django_measurement.utils import get_measurement
 from tests.custom_measure_base import DegreePerTime, Temperature, Time
 from tests.forms import (
     BiDimensionalLabelTestForm,
@@ -135,6 +151,12 @@ class TestMeasurementField:
         ("measurement_custom_degree_per_time", DegreePerTime),
         ("measurement_custom_temperature", Temperature),
         ("measurement_custom_time", Time),
+        ("measurement_distance_lazy", measures.Distance),
+        ("measurement_speed_compact", measures.Speed),
+        ("measurement_weight_trusted", measures.Weight),
+        ("measurement_distance_decimal", measures.Distance),
+        ("measurement_weight_micro", measures.Weight),
+        ("measurement_temperature_int", measures.Temperature),
     ],
 )
 class TestDeconstruct:
@@ -157,11 +179,250 @@ class TestDeconstruct:
         assert field.deconstruct() == (name, path, args, kwargs)
 
 
+class TestStorage:
+    @pytest.fixture
+    def instance(self):
+        return MeasurementTestModel.objects.create(
+            measurement_distance_decimal=Distance(m=1234.5678),
+            measurement_weight_micro=measures.Weight(kg=1.25),
+            measurement_temperature_int=measures.Temperature(f=98.6),
+        )
+
+    def get_columns(self, instance):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT measurement_distance_decimal, measurement_weight_micro,"
+                " measurement_temperature_int FROM tests_measurementtestmodel"
+                " WHERE id = %s",
+                [instance.pk],
+            )
+            return cursor.fetchone()
+
+    def test_columns(self, instance):
+        distance, weight, temperature = self.get_columns(instance)
+
+        assert Decimal(str(distance)) == Decimal("1.235")
+        assert weight == 1250000000
+        assert temperature == 3700
+
+    def test_round_trip(self, instance):
+        instance.refresh_from_db()
+
+        assert instance.measurement_distance_decimal == Distance(km=1.235)
+        assert instance.measurement_distance_decimal.unit == "km"
+        assert instance.measurement_weight_micro == measures.Weight(kg=1.25)
+        assert instance.measurement_temperature_int.c == pytest.approx(37.0)
+
+    def test_lookups(self, instance):
+        queryset = MeasurementTestModel.objects.all()
+
+        assert queryset.filter(measurement_distance_decimal__gt=Distance(m=1000))
+        assert not queryset.filter(measurement_distance_decimal__gt=Distance(mi=1))
+        assert queryset.filter(measurement_weight_micro=measures.Weight(g=1250))
+        assert queryset.filter(
+            measurement_temperature_int__lt=measures.Temperature(c=40)
+        )
+
+    def test_in_unit(self, instance):
+        values = MeasurementTestModel.objects.values_list_in(
+            "measurement_distance_decimal",
+            "measurement_weight_micro",
+            "measurement_temperature_int",
+            unit={
+                "measurement_distance_decimal": "m",
+                "measurement_weight_micro": "lb",
+                "measurement_temperature_int": "f",
+            },
+        ).get()
+
+        assert values == pytest.approx((1235.0, 1.25 / 0.45359237, 98.6))
+
+    def test_aggregate(self, instance):
+        result = MeasurementTestModel.objects.aggregate(
+            total=expressions.Sum("measurement_weight_micro", unit="kg"),
+            distance=expressions.Max("measurement_distance_decimal", unit="m"),
+        )
+
+        assert result["total"] == measures.Weight(kg=1.25)
+        assert result["distance"].m == pytest.approx(1235.0)
+
+    def test_aggregate_offset(self):
+        for c in (20, 30):
+            MeasurementTestModel.objects.create(
+                measurement_temperature=measures.Temperature(c=c),
+                measurement_temperature_int=measures.Temperature(c=c),
+            )
+
+        result = MeasurementTestModel.objects.aggregate(
+            total=expressions.Sum("measurement_temperature"),
+            total_int=expressions.Sum("measurement_temperature_int"),
+            average_int=expressions.Avg("measurement_temperature_int", unit="c"),
+        )
+
+        assert result["total"].k == pytest.approx(596.3)
+        assert result["total_int"].k == pytest.approx(596.3)
+        assert result["average_int"].c == pytest.approx(25)
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            ModelMeasurementField(measurement=Distance, storage_type="double")
+
+        with pytest.raises(TypeError):
+            ModelMeasurementField(measurement=Distance, storage_type="decimal")
+
+    def test_deconstruct(self):
+        field = MeasurementTestModel._meta.get_field("measurement_distance_decimal")
+
+        name, path, args, kwargs = field.deconstruct()
+
+        assert kwargs["storage_unit"] == "km"
+        assert kwargs["storage_type"] == "decimal"
+        assert kwargs["max_digits"] == 12
+        assert kwargs["decimal_places"] == 3
+        assert "storage_scale" not in kwargs
+        assert "storage_type" not in (
+            MeasurementTestModel._meta.get_field("measurement_weight").deconstruct()[3]
+        )
+
+
+class TestStoreUnit:
+    def test_round_trip(self):
+        instance = MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+
+        assert instance.measurement_speed_original_unit == "km__hr"
+
+        instance = MeasurementTestModel.objects.get(pk=instance.pk)
+        value = instance.measurement_speed_original
+
+        assert value.unit == "km__hr"
+        assert value.km__hr == pytest.approx(100)
+        assert type(value) is measures.Speed
+        assert MeasurementTestModel.objects.filter(
+            measurement_speed_original__gt=measures.Speed(mph=60)
+        ).exists()
+
+    def test_built_once(self):
+        MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+
+        with mock.patch(
+            "django_measurement.models.get_measurement", wraps=get_measurement
+        ) as build:
+            MeasurementTestModel.objects.get().measurement_speed_original
+
+        assert build.call_count == 1
+
+    def test_defer(self, django_assert_num_queries):
+        MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+        instance = MeasurementTestModel.objects.defer(
+            "measurement_speed_original"
+        ).get()
+
+        with django_assert_num_queries(1):
+            assert instance.measurement_speed_original.unit == "km__hr"
+
+    def test_only(self):
+        MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+        instance = MeasurementTestModel.objects.only("measurement_speed_original").get()
+
+        assert instance.measurement_speed_original.unit == "km__hr"
+        assert instance.measurement_speed_original_unit == "km__hr"
+        assert instance.measurement_speed_original.unit == "km__hr"
+
+        instance = MeasurementTestModel.objects.only("measurement_speed_original").get()
+        instance.measurement_speed_original = measures.Speed(m__s=10)
+        assert instance.measurement_speed_original_unit == "km__hr"
+        assert instance.measurement_speed_original.unit == "m__s"
+
+    def test_refresh_from_db(self):
+        instance = MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+        instance.measurement_speed_original = measures.Speed(m__s=10)
+
+        instance.refresh_from_db(fields=["measurement_speed_original"])
+
+        assert instance.measurement_speed_original.unit == "km__hr"
+        assert instance.measurement_speed_original.km__hr == pytest.approx(100)
+
+    def test_assignment(self):
+        instance = MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+        instance = MeasurementTestModel.objects.get(pk=instance.pk)
+
+        instance.measurement_speed_original = measures.Speed(mph=10)
+        instance.measurement_speed_original_unit = "km__hr"
+
+        assert instance.measurement_speed_original.unit == "mi__hr"
+
+    def test_unit_outside_choices(self):
+        instance = MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(ft__s=10)
+        )
+        instance.refresh_from_db()
+
+        assert instance.measurement_speed_original_unit == "ft__s"
+        assert instance.measurement_speed_original.unit == "ft__s"
+
+    def test_unknown_unit(self):
+        instance = MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+        MeasurementTestModel.objects.update(measurement_speed_original_unit="parsec")
+        instance.refresh_from_db()
+
+        assert instance.measurement_speed_original.unit == "mi__hr"
+
+    def test_bulk_update(self):
+        instance = MeasurementTestModel.objects.create(
+            measurement_speed_original=measures.Speed(km__hr=100)
+        )
+        instance.measurement_speed_original = measures.Speed(m__s=10)
+        bulk.save_instances(
+            MeasurementTestModel,
+            [instance],
+            update_fields=["measurement_speed_original"],
+        )
+        instance.refresh_from_db()
+
+        assert instance.measurement_speed_original_unit == "m__s"
+        assert instance.measurement_speed_original.unit == "m__s"
+
+    def test_stored_unit(self):
+        field = MeasurementTestModel._meta.get_field("measurement_speed_original")
+
+        assert field.get_stored_unit(measures.Speed(mph=1)) == "mi__hr"
+        assert field.get_stored_unit(1.0) is None
+        assert field.deconstruct()[3]["store_unit"] is True
+
+        unit_field = MeasurementTestModel._meta.get_field(
+            "measurement_speed_original_unit"
+        )
+        assert unit_field.value_field is field
+        assert not unit_field.editable
+
+    def test_migration_state(self):
+        state = ProjectState.from_apps(MeasurementTestModel._meta.apps)
+        model = state.apps.get_model("tests", "MeasurementTestModel")
+
+        names = [field.name for field in model._meta.local_fields]
+        assert names.count("measurement_speed_original_unit") == 1
+
+
 @pytest.mark.parametrize(
     "fieldname, measure, expected_serialized_value",
     [
         ("measurement_weight", measures.Weight(kg=4.0), "4.0:kg"),
         ("measurement_speed", measures.Speed(mi__hr=2.0), "2.0:mi__hr"),
+        ("measurement_temperature", measures.Temperature(f=68), "68.0:f"),
     ],
 )
 class TestSerialization:
@@ -258,6 +519,42 @@ class TestMeasurementFormField:
             ' unit was guessed to be "m".'
         )
 
+    def test_trusted_floats(self, caplog):
+        field = MeasurementTestModel._meta.get_field("measurement_weight_trusted")
+        field.guessed_unit_count = 0
+        field._trusted_warned = False
+
+        for value in (1.5, 2, 3.0):
+            m = MeasurementTestModel(measurement_weight_trusted=value)
+            m.full_clean()
+            assert m.measurement_weight_trusted == measures.Weight(kg=value)
+            assert m.measurement_weight_trusted.unit == "kg"
+
+        assert field.guessed_unit_count == 3
+        assert len(caplog.records) == 1
+        assert caplog.records[0].message == (
+            "You assigned a float instead of Mass to"
+            " tests.models.MeasurementTestModel.measurement_weight_trusted,"
+            ' unit was guessed to be "kg".'
+        )
+
+        m.measurement_weight_trusted = "4:g"
+        m.full_clean()
+        assert m.measurement_weight_trusted == measures.Weight(g=4)
+
+    def test_trusted_floats_context(self, caplog):
+        field = MeasurementTestModel._meta.get_field("measurement_distance_km")
+        field._trusted_warned = False
+        count = field.guessed_unit_count
+
+        with trusted_floats():
+            for value in (1.0, 2.0):
+                assert field.to_python(value) == Distance(km=value)
+
+        assert field.to_python(3.0) == Distance(km=3.0)
+        assert field.guessed_unit_count == count + 3
+        assert len(caplog.records) == 2
+
     def test_unicode_labels(self):
         form = LabelTestForm()
         assert ("c", u"°C") in form.fields["simple"].fields[1].choices
@@ -271,3 +568,45 @@ class TestMeasurementFormField:
         bi_dim_form = BiDimensionalLabelTestForm()
         assert ("c__ms", u"°C/ms") in bi_dim_form.fields["simple"].fields[1].choices
         assert ("c__Ps", u"°C/Ps") in bi_dim_form.fields["simple"].fields[1].choices
+
+    def test_unit_choices_cache(self):
+        field = MeasurementField(measures.Speed)
+        other = MeasurementField(measures.Speed)
+
+        assert field.fields[1].choices == other.fields[1].choices
+        assert get_unit_choices(measures.Speed, "/") is get_unit_choices(
+            measures.Speed, "/"
+        )
+
+        with override_settings(MEASUREMENT_BIDIMENSIONAL_SEPARATOR=" per "):
+            assert get_unit_choices.cache_info().currsize == 0
+            field = MeasurementField(measures.Speed)
+            assert ("mi__hr", "mi per hr") in field.fields[1].choices
+
+        assert get_unit_choices.cache_info().currsize == 0
+
+
+class TestMeasurementWidget:
+    def test_decompress_standard_unit(self):
+        widget = MeasurementWidget(unit_choices=(("km", "km"), ("m", "m")))
+
+        assert widget.decompress(Distance(km=2)) == [2000, "m"]
+        assert widget.decompress(None) == [None, None]
+
+    def test_decompress_first_choice(self):
+        widget = MeasurementWidget(
+            unit_choices=(("mi", "mi"), ("km", "km"), ("ft", "ft"))
+        )
+
+        for _ in range(5):
+            assert widget.decompress(Distance(km=2)) == [
+                pytest.approx(Distance(km=2).mi),
+                "mi",
+            ]
+
+    def test_decompress_preferred_units(self):
+        widget = MeasurementWidget(
+            unit_choices=(("m", "m"), ("km", "km")), preferred_units=("mi", "km")
+        )
+
+        assert widget.decompress(Distance(m=1500)) == [1.5, "km"]
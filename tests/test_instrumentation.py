@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from measurement import measures
+
+from django_measurement import instrumentation
+from django_measurement.models import MeasurementField
+from django_measurement.utils import get_measurement
+from tests.forms import MeasurementTestForm
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+def test_disabled():
+    assert not instrumentation.enabled
+    assert not hasattr(MeasurementField.from_db_value, "__wrapped__")
+
+
+def test_collect_metrics():
+    with instrumentation.collect_metrics() as metrics:
+        assert hasattr(MeasurementField.from_db_value, "__wrapped__")
+        MeasurementTestModel.objects.create(
+            measurement_distance_km=measures.Distance(km=2),
+        )
+        instance = MeasurementTestModel.objects.get()
+        instance.measurement_weight = 2000.0
+        instance.full_clean()
+        form = MeasurementTestForm(
+            {"measurement_distance_0": 2.0, "measurement_distance_1": "mi"}
+        )
+        assert form.is_valid()
+
+    assert not instrumentation.enabled
+    assert not hasattr(MeasurementField.from_db_value, "__wrapped__")
+
+    assert metrics.counts["from_db_value"] == 1
+    assert metrics.counts["compress"] == 1
+    assert metrics.counts["get_prep_value"] >= 1
+    assert metrics.counts["to_python"] >= 1
+    assert metrics.counts["get_measurement"] >= 3
+    assert metrics.warnings == 1
+    assert metrics.units["Distance", "km"] >= 1
+    assert metrics.units["Distance", "mi"] >= 1
+    assert metrics.durations["from_db_value"] > 0
+    assert "from_db_value: 1 in" in str(metrics)
+
+
+def test_nested_collectors():
+    with instrumentation.collect_metrics() as outer:
+        get_measurement(measures.Distance, 1.0, "km")
+        with instrumentation.collect_metrics() as inner:
+            get_measurement(measures.Distance, 1.0, "km")
+        assert instrumentation.enabled
+
+    assert outer.counts["get_measurement"] == 2
+    assert inner.counts["get_measurement"] == 1
+
+
+def test_setting(settings):
+    events = []
+
+    def handler(sender, event, unit, duration, **kwargs):
+        events.append((sender, event, unit))
+
+    instrumentation.measurement_event.connect(handler)
+    try:
+        settings.MEASUREMENT_INSTRUMENTATION = True
+        assert instrumentation.enabled
+        get_measurement(measures.Weight, 1.0, "lb")
+    finally:
+        instrumentation.measurement_event.disconnect(handler)
+
+    assert events == [(measures.Weight, "get_measurement", "lb")]
+
+
+def test_middleware(caplog):
+    def view(request):
+        get_measurement(measures.Distance, 1.0, "km")
+        return HttpResponse()
+
+    middleware = instrumentation.MeasurementMetricsMiddleware(view)
+
+    with caplog.at_level(logging.DEBUG, logger="django_measurement"):
+        middleware(RequestFactory().get("/readings/"))
+
+    assert caplog.records[0].message.startswith(
+        "Measurements for /readings/: get_measurement: 1 in"
+    )
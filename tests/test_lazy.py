@@ -0,0 +1,128 @@
+import pickle
+
+import pytest
+from django.template import Context, Engine
+from django.test import override_settings
+from measurement import measures
+
+from django_measurement.lazy import LazyMeasurement
+from django_measurement.templatetags.measurement import in_unit
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+class TestLazyMeasurement:
+    def test_field_option(self):
+        MeasurementTestModel.objects.create(
+            measurement_distance=measures.Distance(km=2),
+            measurement_distance_lazy=measures.Distance(km=2),
+        )
+
+        retrieved = MeasurementTestModel.objects.get()
+
+        assert type(retrieved.measurement_distance) is measures.Distance
+        assert type(retrieved.measurement_distance_lazy) is LazyMeasurement
+        assert retrieved.measurement_distance_lazy == retrieved.measurement_distance
+
+    @override_settings(MEASUREMENT_LAZY_LOAD=True)
+    def test_setting(self):
+        MeasurementTestModel.objects.create(
+            measurement_speed_mph=measures.Speed(mph=65),
+        )
+
+        value = MeasurementTestModel.objects.get().measurement_speed_mph
+
+        assert type(value) is LazyMeasurement
+        assert isinstance(value, measures.Speed)
+        assert value._wrapped is None
+        assert value.unit == "mi__hr"
+        assert value.value == pytest.approx(65)
+        assert value == measures.Speed(mph=65)
+
+    def test_float_and_comparison_do_not_construct(self):
+        small = LazyMeasurement(measures.Distance, 1000.0, "km")
+        large = LazyMeasurement(measures.Distance, 2000.0, "km")
+
+        assert float(small) == 1000.0
+        assert small < large
+        assert large >= small
+        assert small != large
+        assert small == measures.Distance(km=1)
+        assert small._wrapped is None
+        assert large._wrapped is None
+
+    def test_unit_attribute_and_arithmetic(self):
+        value = LazyMeasurement(measures.Distance, 1000.0, "km")
+
+        assert value.m == 1000.0
+        assert value._wrapped is not None
+        assert value + measures.Distance(km=1) == measures.Distance(km=2)
+        assert measures.Distance(km=1) + value == measures.Distance(km=2)
+        assert value * 2 == measures.Distance(km=2)
+        assert str(value) == "1.0 km"
+
+    def test_mutation(self):
+        value = LazyMeasurement(measures.Weight, 1000.0, "kg")
+        value.unit = "g"
+
+        assert value.unit == "g"
+        assert value.value == 1000.0
+        assert value.standard == 1000.0
+
+    def test_pickle(self):
+        value = LazyMeasurement(measures.Weight, 1000.0, "kg")
+        unpickled = pickle.loads(pickle.dumps(value))
+
+        assert type(unpickled) is LazyMeasurement
+        assert unpickled == value
+
+        value.unit = "g"
+        unpickled = pickle.loads(pickle.dumps(value))
+
+        assert type(unpickled) is measures.Weight
+        assert unpickled.unit == "g"
+
+    def test_unit_attribute_cache(self):
+        value = LazyMeasurement(measures.Distance, 1000.0, "km")
+
+        assert value.mi == pytest.approx(0.621371)
+        assert value._cache[1] == {"mi": value.mi}
+
+        value.standard = 2000.0
+        assert value.mi == pytest.approx(1.242742)
+
+        value += measures.Distance(km=1)
+        assert value.mi == pytest.approx(1.864114)
+
+    def test_unit_attribute_cache_alias(self):
+        value = LazyMeasurement(measures.Distance, 1000.0, "km")
+        alias = value
+        alias += measures.Distance(km=1)
+        assert value.km == 2.0
+
+        alias += measures.Distance(km=1)
+        assert value.standard == 3000.0
+        assert value.km == 3.0
+
+    def test_unit_attribute_cache_bidimensional(self):
+        value = LazyMeasurement(measures.Speed, 10.0, "km__hr")
+        assert value.km__hr == pytest.approx(36.0)
+
+        value.primary.standard = 20.0
+        assert value.km__hr == pytest.approx(0.02)
+
+    def test_in_unit_filter(self):
+        value = LazyMeasurement(measures.Distance, 1609.344, "km")
+        template = Engine(
+            libraries={"measurement": "django_measurement.templatetags.measurement"}
+        ).from_string('{% load measurement %}{{ value|in_unit:"mi" }}')
+
+        assert template.render(Context({"value": value})) == "1.0"
+        assert value._cache[1] == {"mi": 1.0}
+        assert in_unit(measures.Distance(km=1), "m") == 1000.0
+        assert in_unit(value, "parsec") == ""
+        assert in_unit(measures.Speed(mph=1), "foo__bar") == ""
+        assert in_unit(None, "mi") == ""
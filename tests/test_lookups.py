@@ -0,0 +1,81 @@
+import pytest
+from django.db.models import F
+from measurement import measures
+
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.instances(
+        (1, 4, 10),
+        measurement_distance_km=measures.Distance(km=2),
+        measurement_distance_decimal=lambda km: measures.Distance(km=km),
+    ),
+]
+
+
+def distances(queryset):
+    return sorted(m.measurement_distance.km for m in queryset)
+
+
+@pytest.mark.parametrize(
+    "lookup, value, expected",
+    [
+        ("gt", measures.Distance(mi=3), [10]),
+        ("gte", measures.Distance(km=4), [4, 10]),
+        ("lt", measures.Distance(m=4000), [1]),
+        ("lte", measures.Distance(m=4000), [1, 4]),
+        ("exact", measures.Distance(km=4), [4]),
+        ("range", (measures.Distance(km=1), measures.Distance(mi=3)), [1, 4]),
+        ("in", [measures.Distance(km=1), measures.Distance(mi=10)], [1]),
+        ("between_units", (0.5, 2, "mi"), [1]),
+        ("between_units", (1000, 4000), [1, 4]),
+    ],
+)
+def test_lookup(instances, lookup, value, expected):
+    queryset = MeasurementTestModel.objects.filter(
+        **{"measurement_distance__%s" % lookup: value}
+    )
+
+    assert distances(queryset) == pytest.approx(expected)
+
+
+def test_parameters_are_plain_numbers(instances):
+    queryset = MeasurementTestModel.objects.filter(
+        measurement_distance__range=(measures.Distance(km=1), measures.Distance(mi=3))
+    )
+
+    sql, params = queryset.query.sql_with_params()
+
+    assert "BETWEEN %s AND %s" in sql
+    assert params == (1000.0, pytest.approx(4828.032))
+
+
+def test_storage_unit(instances):
+    queryset = MeasurementTestModel.objects.filter(
+        measurement_distance_decimal__between_units=(3000, 5000, "m")
+    )
+
+    assert distances(queryset) == pytest.approx([4])
+
+
+def test_expression(instances):
+    queryset = MeasurementTestModel.objects.filter(
+        measurement_distance__gt=F("measurement_distance_km")
+    )
+
+    assert distances(queryset) == pytest.approx([4, 10])
+
+
+@pytest.mark.parametrize(
+    "lookup, value",
+    [
+        ("gt", measures.Weight(kg=1)),
+        ("in", [measures.Distance(km=1), measures.Weight(kg=1)]),
+    ],
+)
+def test_other_measure(lookup, value):
+    with pytest.raises(ValueError):
+        MeasurementTestModel.objects.filter(
+            **{"measurement_distance__%s" % lookup: value}
+        )
@@ -0,0 +1,124 @@
+import types
+
+import pytest
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from measurement import measures
+
+from django_measurement.operations import ConvertMeasurementUnit
+from django_measurement.query import get_unit_change
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.instances(
+        (1, 2, 3, 4, 5),
+        measurement_temperature=lambda km: measures.Temperature(c=km),
+        measurement_weight_micro=lambda km: measures.Weight(mg=km * 1.5),
+    ),
+]
+
+
+def columns(*names):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT %s FROM tests_measurementtestmodel ORDER BY id" % ", ".join(names)
+        )
+        return cursor.fetchall()
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ((measures.Distance, "m", "km"), (0.001, 0.0)),
+        ((measures.Distance, "km", None, 0, 3), (1000000.0, 0.0)),
+        ((measures.Temperature, "k", "c"), (1.0, -273.15)),
+    ],
+)
+def test_get_unit_change(args, expected):
+    assert get_unit_change(*args) == pytest.approx(expected)
+
+
+class TestConvertUnit:
+    def test_convert(self, instances):
+        count = MeasurementTestModel.objects.convert_unit(
+            "measurement_distance", to_unit="km"
+        )
+
+        assert count == 5
+        assert columns("measurement_distance") == [
+            (1.0,),
+            (2.0,),
+            (3.0,),
+            (4.0,),
+            (5.0,),
+        ]
+
+    def test_batches(self, instances):
+        count = MeasurementTestModel.objects.filter(
+            pk__gt=instances[0].pk
+        ).convert_unit("measurement_temperature", to_unit="c", batch_size=2)
+
+        assert count == 4
+        assert [c for c, in columns("measurement_temperature")] == pytest.approx(
+            [274.15, 2, 3, 4, 5]
+        )
+
+    def test_integer_column(self, instances):
+        MeasurementTestModel.objects.convert_unit(
+            "measurement_weight_micro", from_scale=6, to_scale=3
+        )
+
+        assert columns("measurement_weight_micro") == [
+            (2,),
+            (3,),
+            (5,),
+            (6,),
+            (8,),
+        ]
+
+    def test_same_unit(self, instances):
+        assert not MeasurementTestModel.objects.convert_unit(
+            "measurement_distance", "m", "m"
+        )
+
+
+class TestConvertMeasurementUnit:
+    @pytest.fixture
+    def operation(self):
+        return ConvertMeasurementUnit(
+            "MeasurementTestModel", "measurement_distance", to_unit="mi", batch_size=2
+        )
+
+    def test_forwards_backwards(self, instances, operation):
+        state = ProjectState.from_apps(MeasurementTestModel._meta.apps)
+        schema_editor = types.SimpleNamespace(connection=connection)
+        original = columns("measurement_distance")
+
+        operation.database_forwards("tests", schema_editor, state, state)
+
+        assert [d for d, in columns("measurement_distance")] == pytest.approx(
+            [measures.Distance(km=km).mi for km in (1, 2, 3, 4, 5)]
+        )
+
+        operation.database_backwards("tests", schema_editor, state, state)
+
+        assert [d for d, in columns("measurement_distance")] == pytest.approx(
+            [d for d, in original]
+        )
+
+    def test_deconstruct(self, operation):
+        assert operation.deconstruct() == (
+            "ConvertMeasurementUnit",
+            [],
+            {
+                "model_name": "MeasurementTestModel",
+                "name": "measurement_distance",
+                "to_unit": "mi",
+                "batch_size": 2,
+            },
+        )
+        assert operation.describe() == (
+            "Convert MeasurementTestModel.measurement_distance"
+            " from the standard unit to mi"
+        )
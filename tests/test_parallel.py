@@ -0,0 +1,73 @@
+import concurrent.futures
+
+import pytest
+from measurement import measures
+
+from django_measurement import parallel
+from tests.models import MeasurementTestModel
+
+
+@pytest.fixture
+def executor():
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_convert(executor):
+    pairs = [(1.0, "km"), (2.0, "mi"), (3.0, None), (4.0, "ft")] * 5
+
+    result = parallel.convert(
+        measures.Distance, pairs, "m", chunk_size=3, executor=executor
+    )
+
+    assert list(result) == pytest.approx(
+        [measures.Distance(**{unit or "m": value}).m for value, unit in pairs]
+    )
+
+
+def test_convert_affine(executor):
+    pairs = [(0.0, "c"), (212.0, "f"), (273.15, "k")]
+
+    result = parallel.convert(measures.Temperature, pairs, "c", executor=executor)
+
+    assert list(result) == pytest.approx([0.0, 100.0, 0.0])
+
+
+def test_convert_bidimensional(executor):
+    pairs = [(36.0, "km__hr"), (1.0, "mi__hr")]
+
+    result = parallel.convert(measures.Speed, pairs, "m__s", executor=executor)
+
+    assert list(result) == pytest.approx([10.0, 0.44704])
+
+
+def test_process_pool():
+    pairs = [(float(i), "km") for i in range(10)]
+
+    result = parallel.convert(
+        measures.Distance, pairs, "m", chunk_size=4, max_workers=2
+    )
+
+    assert list(result) == [i * 1000.0 for i in range(10)]
+
+
+@pytest.mark.django_db
+def test_convert_queryset(executor):
+    instances = [
+        MeasurementTestModel.objects.create(
+            measurement_distance_km=measures.Distance(km=km)
+        )
+        for km in (1, 2, 3)
+    ]
+    MeasurementTestModel.objects.create()
+
+    result = parallel.convert_queryset(
+        MeasurementTestModel.objects.order_by("pk"),
+        "measurement_distance_km",
+        chunk_size=2,
+        executor=executor,
+    )
+
+    assert list(result) == [
+        (m.pk, pytest.approx(km)) for m, km in zip(instances, (1, 2, 3))
+    ]
@@ -0,0 +1,71 @@
+import pytest
+from measurement import measures
+
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.instances(
+        (2,),
+        measurement_distance_km=measures.Distance(m=1500),
+        measurement_speed=measures.Speed(mph=10),
+        measurement_temperature=measures.Temperature(c=20),
+    ),
+]
+
+
+@pytest.fixture
+def instance(instances):
+    return instances[0]
+
+
+class TestValuesIn:
+    def test_values_list_flat(self, instance):
+        values = MeasurementTestModel.objects.values_list_in(
+            "measurement_distance", unit="mi", flat=True
+        )
+
+        assert list(values) == [pytest.approx(measures.Distance(km=2).mi)]
+        assert type(values[0]) is float
+
+    def test_default_unit(self, instance):
+        values = MeasurementTestModel.objects.values_list_in(
+            "measurement_distance", "measurement_distance_km", "measurement_speed"
+        ).get()
+
+        assert values == (
+            pytest.approx(2000),
+            pytest.approx(1.5),
+            pytest.approx(measures.Speed(mph=10).m__s),
+        )
+
+    def test_unit_per_field(self, instance):
+        values = MeasurementTestModel.objects.values_in(
+            "id",
+            "measurement_speed",
+            "measurement_temperature",
+            unit={"measurement_speed": "mi__hr", "measurement_temperature": "c"},
+        ).get()
+
+        assert values == {
+            "id": instance.pk,
+            "measurement_speed": pytest.approx(10),
+            "measurement_temperature": pytest.approx(20),
+        }
+
+    def test_named_and_null(self, instance):
+        row = MeasurementTestModel.objects.values_list_in(
+            "measurement_weight",
+            "measurement_distance",
+            named=True,
+            unit={"measurement_distance": "km"},
+        ).get()
+
+        assert row.measurement_weight is None
+        assert row.measurement_distance == pytest.approx(2)
+
+    def test_invalid_unit(self, instance):
+        with pytest.raises(AttributeError):
+            MeasurementTestModel.objects.values_list_in(
+                "measurement_weight", "measurement_distance", unit="km"
+            )
@@ -0,0 +1,161 @@
+import json
+
+import pytest
+from django.core import serializers
+from django.core.serializers.base import DeserializationError
+from measurement import measures
+
+from django_measurement.lazy import LazyMeasurement
+from django_measurement.serializers import decode_measurement, encode_measurement
+from tests.models import MeasurementTestModel
+
+pytestmark = [
+    pytest.mark.django_db,
+]
+
+
+@pytest.fixture(autouse=True)
+def serialization_module(settings):
+    settings.SERIALIZATION_MODULES = {
+        "measurement_json": "django_measurement.serializers"
+    }
+    serializers._serializers = {}
+    yield
+    serializers._serializers = {}
+
+
+@pytest.mark.parametrize(
+    "measure, unit, expected",
+    [
+        (measures.Weight(kg=4.0), None, [4.0, "kg"]),
+        (measures.Weight(kg=4.0), "g", [4000.0, "g"]),
+        (measures.Speed(mi__hr=2.0), None, [2.0, "mi__hr"]),
+        (measures.Temperature(c=20.0), None, [20.0, "c"]),
+        (None, None, None),
+    ],
+)
+def test_encode_measurement(measure, unit, expected):
+    assert encode_measurement(measure, unit) == pytest.approx(expected)
+
+
+def test_encode_lazy_measurement():
+    value = LazyMeasurement(measures.Distance, 1000.0, "km")
+
+    assert encode_measurement(value) == [1.0, "km"]
+    assert value._wrapped is None
+
+
+def test_decode_measurement():
+    value = decode_measurement(measures.Speed, [2.0, "mi__hr"])
+
+    assert value == measures.Speed(mi__hr=2.0)
+    assert value.unit == "mi__hr"
+    assert decode_measurement(measures.Speed, None) is None
+
+
+class TestSerializer:
+    def test_round_trip(self):
+        instance = MeasurementTestModel.objects.create(
+            measurement_distance=measures.Distance(km=2.0),
+            measurement_speed_mph=measures.Speed(mph=3.0),
+            measurement_temperature=measures.Temperature(f=50.0),
+        )
+
+        data = serializers.serialize("measurement_json", [instance])
+
+        fields = json.loads(data)[0]["fields"]
+        assert fields["measurement_distance"] == [2.0, "km"]
+        assert fields["measurement_speed_mph"] == [pytest.approx(3.0), "mi__hr"]
+        assert fields["measurement_weight"] is None
+        assert fields["measurement_temperature"] == [pytest.approx(50.0), "f"]
+
+        (obj,) = serializers.deserialize("measurement_json", data)
+        assert obj.object.measurement_distance == measures.Distance(km=2.0)
+        assert obj.object.measurement_distance.unit == "km"
+        assert obj.object.measurement_speed_mph.mph == pytest.approx(3.0)
+        assert obj.object.measurement_weight is None
+
+    def test_value_unit_strings(self):
+        instance = MeasurementTestModel(
+            pk=1, measurement_weight=measures.Weight(kg=4.0)
+        )
+        data = serializers.serialize("json", [instance])
+
+        (obj,) = serializers.deserialize("measurement_json", data)
+
+        assert obj.object.measurement_weight == measures.Weight(kg=4.0)
+
+    def test_invalid_data(self):
+        data = json.dumps(
+            [
+                {
+                    "model": "tests.measurementtestmodel",
+                    "pk": 1,
+                    "fields": {"measurement_weight": [4.0, "bogus"]},
+                }
+            ]
+        )
+
+        with pytest.raises(DeserializationError):
+            list(serializers.deserialize("measurement_json", data))
+
+
+class TestRestFrameworkField:
+    @pytest.fixture
+    def serializer_class(self):
+        drf_serializers = pytest.importorskip("rest_framework.serializers")
+        from django_measurement import rest_framework
+
+        class MeasurementSerializer(drf_serializers.ModelSerializer):
+            measurement_distance = rest_framework.MeasurementField(required=False)
+            measurement_speed = rest_framework.MeasurementField(
+                measures.Speed, unit="km__hr", required=False
+            )
+
+            class Meta:
+                model = MeasurementTestModel
+                fields = ("measurement_distance", "measurement_speed")
+
+        return MeasurementSerializer
+
+    def test_to_representation(self, serializer_class):
+        instance = MeasurementTestModel(
+            measurement_distance=measures.Distance(mi=2.0),
+            measurement_speed=measures.Speed(km__hr=36.0),
+        )
+
+        data = serializer_class(instance).data
+
+        assert data["measurement_distance"] == [2.0, "mi"]
+        assert data["measurement_speed"] == [pytest.approx(36.0), "km__hr"]
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ([5.0, "km"], measures.Distance(km=5.0)),
+            (["5", "mi"], measures.Distance(mi=5.0)),
+            (5, measures.Distance(m=5.0)),
+        ],
+    )
+    def test_to_internal_value(self, serializer_class, data, expected):
+        serializer = serializer_class(data={"measurement_distance": data})
+
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data["measurement_distance"] == expected
+
+    def test_plain_number_in_unit(self, serializer_class):
+        serializer = serializer_class(data={"measurement_speed": 36})
+
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data["measurement_speed"] == measures.Speed(
+            m__s=10.0
+        )
+
+    @pytest.mark.parametrize(
+        "data, error", [("fast", "invalid"), ([1.0, "bogus"], "invalid_unit")]
+    )
+    def test_invalid(self, serializer_class, data, error):
+        serializer = serializer_class(data={"measurement_distance": data})
+
+        assert not serializer.is_valid()
+        assert serializer.errors["measurement_distance"][0].code == error
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+SETUP = (
+    "import django, sys\n"
+    "from django.conf import settings\n"
+    "settings.configure(INSTALLED_APPS=['django_measurement'])\n"
+    "django.setup()\n"
+    "import django_measurement.models\n"
+)
+
+
+def imported_modules(code=""):
+    """Return the modules imported by a fresh interpreter running ``code``."""
+    output = subprocess.run(
+        [sys.executable, "-c", SETUP + code + "\nprint('\\n'.join(sys.modules))"],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stdout
+    return set(output.splitlines())
+
+
+def test_deferred_imports():
+    modules = imported_modules()
+
+    assert "django_measurement.models" in modules
+    assert "django_measurement.forms" not in modules
+    assert "measurement.measures" not in modules
+
+
+def test_formfield_imports_forms():
+    modules = imported_modules(
+        "from measurement.base import MeasureBase\n"
+        "django_measurement.models.MeasurementField(measurement=MeasureBase).formfield()"
+    )
+
+    assert "django_measurement.forms" in modules
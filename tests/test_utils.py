@@ -0,0 +1,146 @@
+import pytest
+from measurement import measures
+
+from django_measurement import utils
+from django_measurement.utils import (
+    get_conversion_table,
+    get_measurement,
+    get_unit_conversion,
+)
+from tests.custom_measure_base import DegreePerTime, Temperature
+
+
+@pytest.mark.parametrize(
+    "measure, value, unit, original_unit",
+    [
+        (measures.Distance, 5.0, None, "km"),
+        (measures.Distance, 5.0, "mi", None),
+        (measures.Distance, 5, "kilometer", None),
+        (measures.Speed, 12.3, None, "mi__hr"),
+        (measures.Speed, 2.0, "mph", None),
+        (measures.Speed, 2.0, "km__hr", "mi__min"),
+        (measures.Temperature, 300.0, None, "c"),
+        (measures.Temperature, 20.0, "f", None),
+        (measures.Volume, 1.0, "l", "us_pint"),
+        (Temperature, 20.0, "c", "f"),
+    ],
+)
+def test_get_measurement_matches_measure_constructor(
+    measure, value, unit, original_unit
+):
+    expected = utils._build_measurement(
+        measure, value, unit or measure.STANDARD_UNIT, original_unit
+    )
+    measurement = get_measurement(measure, value, unit, original_unit)
+
+    assert type(measurement) is type(expected)
+    assert measurement.unit == expected.unit
+    assert measurement.value == pytest.approx(float(expected.value))
+    assert measurement.standard == pytest.approx(float(expected.standard))
+    assert measurement == expected
+
+
+class TestUnitConversionCache:
+    def setup_method(self):
+        get_measurement.cache_clear()
+
+    def test_cache_info(self):
+        get_measurement(measures.Distance, 1.0, "km")
+        get_measurement(measures.Distance, 2.0, "km")
+        get_measurement(measures.Distance, 2.0, "km", "mi")
+
+        info = get_measurement.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+        assert info.currsize == 2
+        assert info.maxsize == utils.UNIT_CACHE_SIZE
+
+        get_measurement.cache_clear()
+        assert get_measurement.cache_info().currsize == 0
+
+    def test_conversion(self):
+        conversion = get_unit_conversion(measures.Speed, "mph", "km__hr")
+
+        assert conversion.unit == "mi__hr"
+        assert conversion.display_unit == "km__hr"
+        assert conversion.bidimensional
+        assert conversion.factor == pytest.approx(0.44704)
+        assert conversion.offset == 0
+
+        conversion = get_unit_conversion(measures.Temperature, "c")
+
+        assert not conversion.bidimensional
+        assert conversion.factor == 1
+        assert conversion.offset == pytest.approx(273.15)
+
+    def test_invalid_unit(self):
+        with pytest.raises(AttributeError):
+            get_measurement(measures.Distance, 1.0, "parsec")
+
+
+class TestConversionTable:
+    @pytest.mark.parametrize(
+        "measure, unit",
+        [
+            (measures.Speed, "mi__hr"),
+            (measures.Speed, "km__min"),
+            (measures.Speed, "m__s"),
+            (DegreePerTime, "c__s"),
+            (DegreePerTime, "f__h"),
+            (measures.Temperature, "f"),
+        ],
+    )
+    def test_matches_measure(self, measure, unit):
+        factor, offset = get_conversion_table(measure)[unit]
+
+        for value in (0.0, 2.5, 98.6):
+            expected = float(measure(**{unit: value}).standard)
+            assert value * factor + offset == pytest.approx(expected)
+
+    def test_bidimensional_units(self):
+        table = get_conversion_table(measures.Speed)
+
+        assert len(table) == len(measures.Distance.get_units()) * len(
+            measures.Time.get_units()
+        )
+        assert "mph" not in table
+        assert table["mi__hr"] == pytest.approx((0.44704, 0))
+
+    @pytest.mark.parametrize(
+        "measure, unit",
+        [
+            (measures.Distance, "mi"),
+            (measures.Speed, "km__hr"),
+            (measures.Temperature, "c"),
+            (measures.Temperature, "f"),
+            (DegreePerTime, "f__s"),
+        ],
+    )
+    def test_from_standard(self, measure, unit):
+        value = measure(**{unit: 98.6})
+
+        assert utils.from_standard(
+            measure, unit, float(value.standard)
+        ) == pytest.approx(98.6, rel=1e-12)
+
+    def test_from_standard_precision(self):
+        standard = float(measures.Temperature(c=20).standard)
+
+        assert utils.from_standard(measures.Temperature, "f", standard) == 68.0
+        assert utils.get_inverse_conversion_table(measures.Temperature)["f"] == (
+            pytest.approx(1.8),
+            pytest.approx(-459.67),
+        )
+        with pytest.raises(KeyError):
+            utils.from_standard(measures.Temperature, "parsec", standard)
+
+    def test_magnitude(self):
+        speed = measures.Speed(mph=10)
+
+        assert utils.get_magnitude(speed) == (pytest.approx(10), "mi__hr")
+        assert utils.get_magnitude(speed, "km__hr") == (
+            pytest.approx(16.09344),
+            "km__hr",
+        )
+        assert utils.get_magnitude(speed, "mph") == (pytest.approx(10), "mi__hr")
+        assert utils.get_magnitude(measures.Temperature(f=68)) == (68.0, "f")
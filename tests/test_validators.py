@@ -0,0 +1,64 @@
+import pytest
+from django.core.exceptions import ValidationError
+from measurement import measures
+
+from django_measurement.forms import MeasurementField
+from django_measurement.lazy import LazyMeasurement
+from django_measurement.validators import (
+    MaxMeasurementValidator,
+    MinMeasurementValidator,
+    get_bounds,
+)
+from tests.models import MeasurementTestModel
+
+
+class TestMeasurementValidators:
+    def test_bounds(self):
+        validator = MinMeasurementValidator(measures.Speed(mph=1))
+
+        assert validator.standard == pytest.approx(0.44704)
+        validator(measures.Speed(km__hr=2))
+        validator(LazyMeasurement(measures.Speed, 1.0, "mi__hr"))
+        with pytest.raises(ValidationError) as e:
+            validator(measures.Speed(km__hr=1))
+        assert e.value.messages == [
+            "Ensure this value is greater than or equal to 1.0 mi/hr."
+        ]
+
+        with pytest.raises(ValidationError):
+            MaxMeasurementValidator(measures.Distance(km=1))(measures.Distance(mi=1))
+
+    def test_other_measure(self):
+        with pytest.raises(TypeError):
+            MinMeasurementValidator(measures.Distance(km=1))(measures.Weight(kg=2))
+
+    def test_deconstruct(self):
+        validator = MaxMeasurementValidator(measures.Weight(kg=2))
+
+        path, args, kwargs = validator.deconstruct()
+
+        assert path == "django_measurement.validators.MaxMeasurementValidator"
+        assert args == (measures.Weight(kg=2),)
+        assert validator == MaxMeasurementValidator(measures.Weight(g=2000))
+
+    def test_form_field(self):
+        field = MeasurementField(
+            measures.Distance,
+            min_value=measures.Distance(mi=1),
+            max_value=measures.Distance(mi=2),
+        )
+
+        assert [type(v) for v in field.validators] == [
+            MinMeasurementValidator,
+            MaxMeasurementValidator,
+        ]
+
+    def test_get_bounds(self):
+        field = MeasurementTestModel._meta.get_field("measurement_distance")
+
+        bounds = list(get_bounds(field.validators, measures.Distance))
+
+        assert [limit for validator, limit in bounds] == pytest.approx(
+            [1609.344, 4828.032]
+        )
+        assert not list(get_bounds(field.validators, measures.Weight))
@@ -0,0 +1,76 @@
+import pytest
+from django.core.exceptions import ValidationError
+from measurement import measures
+
+from django_measurement.forms import MeasurementField
+from django_measurement.utils import get_measurement
+from tests.models import MeasurementTestModel
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("django_measurement.vectorized")
+
+
+@pytest.mark.parametrize(
+    "measure, unit, to_unit",
+    [
+        (measures.Distance, "km", "mi"),
+        (measures.Distance, None, "ft"),
+        (measures.Weight, "lb", None),
+        (measures.Temperature, "c", "f"),
+        (measures.Speed, "mph", "km__hr"),
+        (measures.Speed, ("m", "s"), ("mi", "min")),
+    ],
+)
+def test_convert(measure, unit, to_unit):
+    values = np.array([0.0, 1.5, 20.0, -3.25])
+
+    converted = vectorized.convert(measure, values, unit=unit, to_unit=to_unit)
+
+    expected = [
+        getattr(
+            get_measurement(measure, v, vectorized._unit_name(unit)),
+            vectorized._unit_name(to_unit) or measure.STANDARD_UNIT,
+        )
+        for v in values
+    ]
+    assert converted.dtype == np.float64
+    np.testing.assert_allclose(converted, expected)
+
+
+def test_to_and_from_standard():
+    values = np.array([1.0, 2.0, 3.0])
+
+    standard = vectorized.to_standard(measures.Distance, values, unit="km")
+    np.testing.assert_allclose(standard, [1000.0, 2000.0, 3000.0])
+
+    vectorized.from_standard(measures.Distance, standard, to_unit="km", out=standard)
+    np.testing.assert_allclose(standard, values)
+
+
+def test_get_scale():
+    assert vectorized.get_scale(measures.Distance, "km", "m") == (1000.0, 0.0)
+    assert vectorized.get_scale(measures.Temperature, "c") == (1.0, 273.15)
+
+
+def test_validate_many():
+    field = MeasurementTestModel._meta.get_field("measurement_distance")
+
+    vectorized.validate_many(field, np.array([1.0, 2.0, 3.0]), unit="mi")
+
+    with pytest.raises(ValidationError) as e:
+        vectorized.validate_many(field, [0.5, 2.0, 4.0, 1.0], unit="mi")
+
+    assert [error.params["index"] for error in e.value.error_list] == [0, 2]
+    assert e.value.messages == [
+        "Ensure this value is greater than or equal to 1.0 mi.",
+        "Ensure this value is less than or equal to 3.0 mi.",
+    ]
+
+
+def test_validate_many_form_field():
+    field = MeasurementField(measures.Speed, max_value=measures.Speed(mph=60))
+
+    with pytest.raises(ValidationError) as e:
+        vectorized.validate_many(field, np.array([50.0, 100.0]), unit="km__hr")
+
+    assert e.value.error_list[0].params["index"] == 1